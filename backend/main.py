@@ -524,6 +524,9 @@ async def lifespan(app: FastAPI):
         yield
     finally:
         await stop_submission_attempt_cleanup()
+        from src.lib.packages.package_runner import shutdown_shared_package_worker_pool
+
+        shutdown_shared_package_worker_pool()
         logger.info("Shutting down Weaviate Control Panel API...")
         try:
             await connection.close()
@@ -850,6 +853,20 @@ async def deep_health_check():
         health_status["services"]["redis"] = "disconnected"
         health_status["status"] = "degraded"
 
+    # Warm package tool worker pool counters (only once the pool is in use)
+    from src.lib.packages.package_runner import get_package_worker_pool_metrics
+
+    package_worker_pool = get_package_worker_pool_metrics()
+    if package_worker_pool is not None:
+        health_status["package_worker_pool"] = package_worker_pool
+
+    # Shared curation lookup cache hit/miss counters (only when enabled)
+    from src.lib.database.curation_lookup_cache import get_curation_lookup_cache_metrics
+
+    curation_lookup_cache = get_curation_lookup_cache_metrics()
+    if curation_lookup_cache is not None:
+        health_status["curation_lookup_cache"] = curation_lookup_cache
+
     return health_status
 
 
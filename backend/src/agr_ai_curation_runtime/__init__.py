@@ -1,6 +1,12 @@
 """Public runtime surfaces exposed to isolated package tools."""
 
-from .agr_curation import get_curation_resolver, is_valid_curie, list_groups
+from .agr_curation import (
+    build_lookup_cache_key,
+    get_curation_lookup_cache,
+    get_curation_resolver,
+    is_valid_curie,
+    list_groups,
+)
 from .chunk_identity import resolve_chunk_identifier
 from .file_outputs import (
     FileOutputRequestContext,
@@ -28,6 +34,8 @@ from .weaviate_chunks import (
 )
 
 __all__ = [
+    "build_lookup_cache_key",
+    "get_curation_lookup_cache",
     "get_curation_resolver",
     "is_valid_curie",
     "list_groups",
@@ -1,8 +1,9 @@
 """Public AGR curation runtime helpers for package-owned tools.
 
-This boundary exposes the three backend-owned services the packaged AGR
-curation tool needs at runtime:
+This boundary exposes the backend-owned services the packaged AGR curation
+tool needs at runtime:
 - curation DB connection resolution,
+- the shared cross-request lookup result cache,
 - CURIE prefix validation, and
 - group configuration loading for provider-to-taxon mapping.
 """
@@ -18,6 +19,11 @@ def _load_curation_resolver_module() -> Any:
     return import_module("src.lib.database.curation_resolver")
 
 
+def _load_lookup_cache_module() -> Any:
+    """Resolve the backend lookup result cache lazily."""
+    return import_module("src.lib.database.curation_lookup_cache")
+
+
 def _load_identifier_validation_module() -> Any:
     """Resolve the backend identifier validator lazily."""
     return import_module("src.lib.identifier_validation")
@@ -33,6 +39,16 @@ def get_curation_resolver() -> Any:
     return _load_curation_resolver_module().get_curation_resolver()
 
 
+def get_curation_lookup_cache() -> Any:
+    """Return the shared lookup result cache, or ``None`` when disabled."""
+    return _load_lookup_cache_module().get_curation_lookup_cache()
+
+
+def build_lookup_cache_key(method: str, arguments: Any) -> str:
+    """Return the normalized cache key for one lookup method call."""
+    return _load_lookup_cache_module().build_lookup_cache_key(method, arguments)
+
+
 def is_valid_curie(curie: str) -> bool:
     """Validate a CURIE against the loaded runtime prefix state."""
     return _load_identifier_validation_module().is_valid_curie(curie)
@@ -44,6 +60,8 @@ def list_groups() -> Any:
 
 
 __all__ = [
+    "build_lookup_cache_key",
+    "get_curation_lookup_cache",
     "get_curation_resolver",
     "is_valid_curie",
     "list_groups",
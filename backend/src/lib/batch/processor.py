@@ -1,13 +1,17 @@
 """Batch processing background task implementation.
 
-Processes documents sequentially using the selected flow, persisting
-state after each document for crash recovery. Supports cancellation.
+Processes documents using the selected flow, persisting state after each
+document for crash recovery. Supports cancellation. Documents run one at a
+time by default; BATCH_DOCUMENT_CONCURRENCY lets several documents of one
+batch run at once, bounded process-wide by BATCH_GLOBAL_DOCUMENT_CONCURRENCY.
 
 Architecture:
     BackgroundTasks runs synchronous functions in a thread pool.
     We use asyncio.run() to execute the async flow executor from
     within the synchronous task. Each document gets its own asyncio
-    event loop iteration.
+    event loop iteration. Concurrent documents each run on their own
+    worker thread with their own database session; counter updates stay
+    serialized by the batch row lock taken at every write checkpoint.
 
     Events from the flow executor are published to the BatchEventBroadcaster,
     which allows the SSE endpoint to stream them to the frontend in real-time.
@@ -16,6 +20,7 @@ import asyncio
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
@@ -31,6 +36,8 @@ from src.models.sql.file_output import FileOutput
 from src.models.sql.pdf_document import PDFDocument
 from src.lib.observability.background_tasks import report_background_task_exception
 from src.lib.openai_agents.config import (
+    get_batch_document_concurrency,
+    get_batch_global_document_concurrency,
     get_batch_worker_heartbeat_seconds,
     get_batch_worker_lease_seconds,
 )
@@ -40,6 +47,8 @@ from .status import require_batch_document_status_transition
 
 logger = logging.getLogger(__name__)
 _BACKEND_ONLY_EVENT_FIELDS = {"internal"}
+_global_document_slots: Optional[threading.BoundedSemaphore] = None
+_global_document_slots_lock = threading.Lock()
 
 
 class BatchFlowExecutionError(RuntimeError):
@@ -246,44 +255,66 @@ def _process_claimed_batch(
 
     logger.info("Batch lease acquired: batch_id=%s, flow=%s", batch_id, flow.name)
 
-    for batch_doc in batch.documents:
-        if batch_doc.status != BatchDocumentStatus.PENDING:
-            continue
-        try:
-            _require_running_batch(db, batch, lease_owner=lease_owner)
-            _process_single_document(
-                db, batch, batch_doc, flow, cognito_sub, lease_owner=lease_owner
-            )
-        except BatchCancelled:
-            db.rollback()
-            logger.info("Batch cancelled during document processing: batch_id=%s", batch_id)
-            break
-        except Exception as error:
-            db.rollback()
-            _report_document_failure(error, batch_id, batch_doc)
-            batch = db.get(Batch, batch_id)
-            batch_doc = db.get(BatchDocument, batch_doc.id)
-            if not batch or not batch_doc:
+    pending_document_ids = [
+        batch_doc.id
+        for batch_doc in batch.documents
+        if batch_doc.status == BatchDocumentStatus.PENDING
+    ]
+    concurrency = min(get_batch_document_concurrency(), len(pending_document_ids))
+    batch_started = time.monotonic()
+    document_timings: list[int] = []
+
+    if concurrency <= 1:
+        for batch_doc in batch.documents:
+            if batch_doc.status != BatchDocumentStatus.PENDING:
                 continue
-            try:
-                _require_running_batch(
-                    db, batch, lock_for_update=True, lease_owner=lease_owner
-                )
-            except BatchCancelled:
-                logger.info(
-                    "Skipping document failure update after lease loss: batch_id=%s",
-                    batch_id,
-                )
+            if not _process_pending_document(
+                db,
+                service,
+                batch,
+                batch_doc,
+                flow,
+                cognito_sub,
+                lease_owner,
+                batch_started=batch_started,
+                document_timings=document_timings,
+            ):
                 break
-            if batch_doc.status != BatchDocumentStatus.FAILED:
-                require_batch_document_status_transition(
-                    batch_doc.status, BatchDocumentStatus.FAILED
-                )
-                batch_doc.status = BatchDocumentStatus.FAILED
-                batch_doc.error_message = str(error)[:500]
-                batch_doc.processed_at = datetime.now(timezone.utc)
-                service.recompute_batch_counters(batch)
-                db.commit()
+    else:
+        _process_pending_documents_concurrently(
+            batch_id,
+            pending_document_ids,
+            flow.id,
+            cognito_sub,
+            lease_owner,
+            concurrency=concurrency,
+            batch_started=batch_started,
+            document_timings=document_timings,
+        )
+        # Document threads committed through their own sessions.
+        db.expire_all()
+
+    if document_timings:
+        wall_ms = int((time.monotonic() - batch_started) * 1000)
+        document_ms_total = sum(document_timings)
+        logger.info(
+            "Batch throughput: batch_id=%s, documents=%d, concurrency=%d, wall_ms=%d, "
+            "document_ms_total=%d, effective_parallelism=%.2f",
+            batch_id,
+            len(document_timings),
+            max(concurrency, 1),
+            wall_ms,
+            document_ms_total,
+            document_ms_total / wall_ms if wall_ms else 0.0,
+            extra={
+                "operation": "batch_throughput",
+                "batch_id": str(batch_id),
+                "documents": len(document_timings),
+                "concurrency": max(concurrency, 1),
+                "wall_ms": wall_ms,
+                "document_ms_total": document_ms_total,
+            },
+        )
 
     if service.complete_running_batch(batch_id, lease_owner):
         logger.info(
@@ -292,6 +323,185 @@ def _process_claimed_batch(
         )
 
 
+def _process_pending_document(
+    db: Session,
+    service: BatchService,
+    batch: Batch,
+    batch_doc: BatchDocument,
+    flow: CurationFlow,
+    cognito_sub: str,
+    lease_owner: UUID,
+    *,
+    batch_started: float,
+    document_timings: list[int],
+) -> bool:
+    """Process one pending document and record its failure durably.
+
+    Returns False once the batch must stop scheduling documents because it
+    was cancelled or this worker lost its lease.
+    """
+    batch_id = batch.id
+    document_started = time.monotonic()
+    try:
+        _require_running_batch(db, batch, lease_owner=lease_owner)
+        _process_single_document(
+            db, batch, batch_doc, flow, cognito_sub, lease_owner=lease_owner
+        )
+    except BatchCancelled:
+        db.rollback()
+        logger.info("Batch cancelled during document processing: batch_id=%s", batch_id)
+        return False
+    except Exception as error:
+        db.rollback()
+        _report_document_failure(error, batch_id, batch_doc)
+        batch = db.get(Batch, batch_id)
+        batch_doc = db.get(BatchDocument, batch_doc.id)
+        if not batch or not batch_doc:
+            return True
+        try:
+            _require_running_batch(
+                db, batch, lock_for_update=True, lease_owner=lease_owner
+            )
+        except BatchCancelled:
+            logger.info(
+                "Skipping document failure update after lease loss: batch_id=%s",
+                batch_id,
+            )
+            return False
+        if batch_doc.status != BatchDocumentStatus.FAILED:
+            require_batch_document_status_transition(
+                batch_doc.status, BatchDocumentStatus.FAILED
+            )
+            batch_doc.status = BatchDocumentStatus.FAILED
+            batch_doc.error_message = str(error)[:500]
+            batch_doc.processed_at = datetime.now(timezone.utc)
+            service.recompute_batch_counters(batch)
+            db.commit()
+    finally:
+        _log_document_timing(
+            batch_id,
+            batch_doc,
+            batch_started=batch_started,
+            document_started=document_started,
+            document_timings=document_timings,
+        )
+    return True
+
+
+def _log_document_timing(
+    batch_id: UUID,
+    batch_doc: BatchDocument,
+    *,
+    batch_started: float,
+    document_started: float,
+    document_timings: list[int],
+) -> None:
+    """Emit queue-wait and elapsed time for one finished batch document."""
+    finished = time.monotonic()
+    elapsed_ms = int((finished - document_started) * 1000)
+    wait_ms = int((document_started - batch_started) * 1000)
+    # list.append is atomic, so concurrent document threads can share the list.
+    document_timings.append(elapsed_ms)
+    logger.info(
+        "Batch document timing: batch_id=%s, doc_id=%s, status=%s, wait_ms=%d, elapsed_ms=%d",
+        batch_id,
+        batch_doc.document_id,
+        getattr(batch_doc.status, "value", batch_doc.status),
+        wait_ms,
+        elapsed_ms,
+        extra={
+            "operation": "batch_document_timing",
+            "batch_id": str(batch_id),
+            "document_id": str(batch_doc.document_id),
+            "wait_ms": wait_ms,
+            "elapsed_ms": elapsed_ms,
+        },
+    )
+
+
+def _get_global_document_slots() -> threading.BoundedSemaphore:
+    """Return the process-wide cap on concurrently executing batch documents."""
+    global _global_document_slots
+
+    with _global_document_slots_lock:
+        if _global_document_slots is None:
+            _global_document_slots = threading.BoundedSemaphore(
+                get_batch_global_document_concurrency()
+            )
+        return _global_document_slots
+
+
+def _process_pending_documents_concurrently(
+    batch_id: UUID,
+    batch_document_ids: list[UUID],
+    flow_id: UUID,
+    cognito_sub: str,
+    lease_owner: UUID,
+    *,
+    concurrency: int,
+    batch_started: float,
+    document_timings: list[int],
+) -> None:
+    """Run several pending documents at once, each on its own DB session.
+
+    A document that observes cancellation or lease loss stops the batch from
+    scheduling further documents; documents already in flight stop at their
+    own next checkpoint.
+    """
+    stopped = threading.Event()
+    global_slots = _get_global_document_slots()
+
+    def run_document(batch_document_id: UUID) -> None:
+        with global_slots:
+            if stopped.is_set():
+                return
+            with get_db_session() as document_db:
+                document_service = BatchService(document_db)
+                batch = document_db.get(Batch, batch_id)
+                batch_doc = document_db.get(BatchDocument, batch_document_id)
+                flow = document_db.get(CurationFlow, flow_id)
+                if not batch or not batch_doc or not flow:
+                    return
+                if batch_doc.status != BatchDocumentStatus.PENDING:
+                    return
+                if not _process_pending_document(
+                    document_db,
+                    document_service,
+                    batch,
+                    batch_doc,
+                    flow,
+                    cognito_sub,
+                    lease_owner,
+                    batch_started=batch_started,
+                    document_timings=document_timings,
+                ):
+                    stopped.set()
+
+    logger.info(
+        "Processing batch documents concurrently: batch_id=%s, documents=%d, concurrency=%d",
+        batch_id,
+        len(batch_document_ids),
+        concurrency,
+    )
+    with ThreadPoolExecutor(
+        max_workers=concurrency,
+        thread_name_prefix=f"batch-{batch_id}",
+    ) as executor:
+        futures = [
+            executor.submit(run_document, batch_document_id)
+            for batch_document_id in batch_document_ids
+        ]
+        for future in futures:
+            try:
+                future.result()
+            except Exception:
+                # Failures are already recorded per document; never let one
+                # worker's unexpected error abandon the rest of the batch.
+                logger.exception(
+                    "Unexpected batch document worker error: batch_id=%s", batch_id
+                )
+
+
 def _report_document_failure(
     error: Exception,
     batch_id: UUID,
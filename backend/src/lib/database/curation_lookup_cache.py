@@ -0,0 +1,262 @@
+"""Shared result cache for curation-DB entity and ontology lookups.
+
+Specialists resolve the same genes, alleles, ontology terms and vocabulary
+terms across turns, sessions and batch documents. ``CurationLookupCache`` keeps
+serialized lookup results keyed by method plus normalized arguments, with a
+TTL and a size-bounded in-process LRU. With the Redis backend the LRU is a
+near cache in front of Redis, so every worker and package subprocess shares
+entries and hit/miss counters.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Optional
+
+from src.lib.openai_agents.config import (
+    get_curation_lookup_cache_backend,
+    get_curation_lookup_cache_enabled,
+    get_curation_lookup_cache_max_entries,
+    get_curation_lookup_cache_ttl_seconds,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "agr:lookup-cache:v1:"
+CACHE_STATS_KEY = "agr:lookup-cache:v1:stats"
+CACHE_BACKEND_MEMORY = "memory"
+CACHE_BACKEND_REDIS = "redis"
+
+_COUNTER_NAMES = (
+    "hits",
+    "misses",
+    "local_hits",
+    "redis_hits",
+    "stores",
+    "bypasses",
+    "evictions",
+    "expirations",
+    "redis_errors",
+)
+
+
+def _normalize_argument(value: Any) -> Any:
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, Mapping):
+        return {
+            str(key): _normalize_argument(item)
+            for key, item in value.items()
+            if item is not None
+        }
+    if isinstance(value, (list, tuple)):
+        return [_normalize_argument(item) for item in value]
+    return value
+
+
+def build_lookup_cache_key(method: str, arguments: Mapping[str, Any]) -> str:
+    """Return a stable cache key for one lookup method call.
+
+    ``None`` arguments are dropped and strings are stripped so equivalent calls
+    share an entry; list order is kept because it shapes result order.
+    """
+    normalized = {
+        str(name): _normalize_argument(value)
+        for name, value in arguments.items()
+        if value is not None
+    }
+    digest = hashlib.sha256(
+        json.dumps(normalized, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    ).hexdigest()
+    return f"{CACHE_KEY_PREFIX}{method}:{digest}"
+
+
+@dataclass
+class _CacheEntry:
+    payload: str
+    expires_at: float
+
+
+class CurationLookupCache:
+    """TTL + LRU cache of serialized lookup results with an optional Redis tier."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        redis_factory: Optional[Callable[[], Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._redis_factory = redis_factory
+        self._clock = clock
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(_COUNTER_NAMES, 0)
+
+    @property
+    def backend(self) -> str:
+        return CACHE_BACKEND_REDIS if self._redis_factory is not None else CACHE_BACKEND_MEMORY
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached payload for ``key`` or ``None`` on a miss."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._count("hits", "local_hits")
+                    return entry.payload
+                del self._entries[key]
+                self._count("expirations")
+
+        if self._redis_factory is not None:
+            try:
+                payload = self._redis_factory().get(key)
+            except Exception as exc:
+                logger.warning("Curation lookup cache Redis read failed: %s", exc)
+                self._count("redis_errors")
+                payload = None
+            if payload is not None:
+                self._store_local(key, payload)
+                self._count("hits", "redis_hits")
+                return payload
+
+        self._count("misses")
+        return None
+
+    def set(self, key: str, payload: str) -> None:
+        """Store a serialized lookup result for the configured TTL."""
+        self._store_local(key, payload)
+        self._count("stores")
+        if self._redis_factory is not None:
+            try:
+                self._redis_factory().setex(key, max(1, int(self._ttl_seconds)), payload)
+            except Exception as exc:
+                logger.warning("Curation lookup cache Redis write failed: %s", exc)
+                self._count("redis_errors")
+
+    def record_bypass(self) -> None:
+        """Count a caller that skipped the cache read (e.g. ``force=True``)."""
+        self._count("bypasses")
+
+    def clear(self) -> None:
+        """Drop every in-process entry (shared Redis entries expire by TTL)."""
+        with self._lock:
+            self._entries.clear()
+
+    def metrics_snapshot(self) -> dict[str, Any]:
+        """Return hit/miss counters for this process and, with Redis, all workers."""
+        with self._lock:
+            counters = dict(self._counters)
+            size = len(self._entries)
+        lookups = counters["hits"] + counters["misses"]
+        snapshot: dict[str, Any] = {
+            "backend": self.backend,
+            "ttl_seconds": self._ttl_seconds,
+            "max_entries": self._max_entries,
+            "size": size,
+            **counters,
+            "hit_ratio": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+        }
+        if self._redis_factory is not None:
+            try:
+                shared = self._redis_factory().hgetall(CACHE_STATS_KEY) or {}
+                shared_counters = {name: int(shared.get(name, 0)) for name in _COUNTER_NAMES}
+                shared_lookups = shared_counters["hits"] + shared_counters["misses"]
+                snapshot["shared"] = {
+                    **shared_counters,
+                    "hit_ratio": (
+                        round(shared_counters["hits"] / shared_lookups, 4)
+                        if shared_lookups
+                        else 0.0
+                    ),
+                }
+            except Exception as exc:
+                logger.warning("Curation lookup cache Redis stats read failed: %s", exc)
+                snapshot["shared"] = None
+        return snapshot
+
+    def _store_local(self, key: str, payload: str) -> None:
+        with self._lock:
+            self._entries[key] = _CacheEntry(payload, self._clock() + self._ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def _count(self, *names: str) -> None:
+        with self._lock:
+            for name in names:
+                self._counters[name] += 1
+        if self._redis_factory is not None and "redis_errors" not in names:
+            try:
+                pipeline = self._redis_factory().pipeline(transaction=False)
+                for name in names:
+                    pipeline.hincrby(CACHE_STATS_KEY, name, 1)
+                pipeline.execute()
+            except Exception:
+                # Shared counters are best effort; local counters stay exact.
+                with self._lock:
+                    self._counters["redis_errors"] += 1
+
+
+_lookup_cache: Optional[CurationLookupCache] = None
+_lookup_cache_lock = threading.Lock()
+
+
+def _build_lookup_cache_from_config() -> CurationLookupCache:
+    redis_factory = None
+    if get_curation_lookup_cache_backend() == CACHE_BACKEND_REDIS:
+        from src.lib.redis_client import get_sync_redis
+
+        redis_factory = get_sync_redis
+    return CurationLookupCache(
+        ttl_seconds=get_curation_lookup_cache_ttl_seconds(),
+        max_entries=get_curation_lookup_cache_max_entries(),
+        redis_factory=redis_factory,
+    )
+
+
+def get_curation_lookup_cache() -> Optional[CurationLookupCache]:
+    """Return the process-wide lookup cache, or ``None`` when disabled."""
+    global _lookup_cache
+
+    if not get_curation_lookup_cache_enabled():
+        return None
+    with _lookup_cache_lock:
+        if _lookup_cache is None:
+            _lookup_cache = _build_lookup_cache_from_config()
+        return _lookup_cache
+
+
+def get_curation_lookup_cache_metrics() -> Optional[dict[str, Any]]:
+    """Return cache counters for health endpoints, or ``None`` when disabled."""
+    cache = get_curation_lookup_cache()
+    return cache.metrics_snapshot() if cache is not None else None
+
+
+def reset_curation_lookup_cache() -> None:
+    """Drop the process-wide cache so the next access rereads configuration."""
+    global _lookup_cache
+
+    with _lookup_cache_lock:
+        _lookup_cache = None
+
+
+__all__ = [
+    "CurationLookupCache",
+    "build_lookup_cache_key",
+    "get_curation_lookup_cache",
+    "get_curation_lookup_cache_metrics",
+    "reset_curation_lookup_cache",
+]
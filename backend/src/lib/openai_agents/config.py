@@ -133,6 +133,16 @@ def get_batch_recovery_max_concurrency() -> int:
     return max(1, _get_env_int_with_fallback("BATCH_RECOVERY_MAX_CONCURRENCY", 4))
 
 
+def get_batch_document_concurrency() -> int:
+    """Documents of one batch whose flows may run at the same time (default 1)."""
+    return max(1, _get_env_int_with_fallback("BATCH_DOCUMENT_CONCURRENCY", 1))
+
+
+def get_batch_global_document_concurrency() -> int:
+    """Process-wide cap on batch documents executing flows at once (default 4)."""
+    return max(1, _get_env_int_with_fallback("BATCH_GLOBAL_DOCUMENT_CONCURRENCY", 4))
+
+
 def get_submission_attempt_retention_days() -> int:
     """Days to retain terminal direct-submission attempts for audit and deduplication."""
     return max(1, _get_env_int_with_fallback("SUBMISSION_ATTEMPT_RETENTION_DAYS", 90))
@@ -1427,6 +1437,73 @@ def get_package_runner_timeout_seconds() -> float:
     return max(1.0, _get_env_float_with_fallback("PACKAGE_RUNNER_TIMEOUT_SECONDS", 60.0))
 
 
+def get_package_runner_worker_pool_enabled() -> bool:
+    """Serve package tool calls from warm worker processes (PACKAGE_RUNNER_WORKER_POOL_ENABLED).
+
+    When enabled, each package environment keeps long-lived worker interpreters
+    so tool calls skip Python startup and package imports. Default false (one
+    fresh subprocess per call).
+    """
+    return _get_env_bool("PACKAGE_RUNNER_WORKER_POOL_ENABLED", False)
+
+
+def get_package_runner_worker_pool_size() -> int:
+    """Max warm workers per package environment (PACKAGE_RUNNER_WORKER_POOL_SIZE).
+
+    Also the number of concurrent tool calls per package; extra calls queue.
+    Default 4.
+    """
+    return max(1, _get_env_int_with_fallback("PACKAGE_RUNNER_WORKER_POOL_SIZE", 4))
+
+
+def get_package_runner_worker_max_requests() -> int:
+    """Calls a warm worker serves before it is recycled (PACKAGE_RUNNER_WORKER_MAX_REQUESTS).
+
+    Bounds leaked module state and memory growth inside long-lived workers.
+    Default 200.
+    """
+    return max(1, _get_env_int_with_fallback("PACKAGE_RUNNER_WORKER_MAX_REQUESTS", 200))
+
+
+def get_curation_lookup_cache_enabled() -> bool:
+    """Cache curation-DB lookup results across requests (CURATION_LOOKUP_CACHE_ENABLED).
+
+    Default false (every agr_curation_query call hits the curation DB).
+    """
+    return _get_env_bool("CURATION_LOOKUP_CACHE_ENABLED", False)
+
+
+def get_curation_lookup_cache_backend() -> str:
+    """Lookup cache storage tier (CURATION_LOOKUP_CACHE_BACKEND).
+
+    "memory" keeps a per-process LRU; "redis" shares entries and counters
+    across workers through REDIS_URL with the LRU as a near cache. Default memory.
+    """
+    backend = _get_env("CURATION_LOOKUP_CACHE_BACKEND", "memory").strip().lower()
+    if backend not in {"memory", "redis"}:
+        logger.warning(
+            "Invalid CURATION_LOOKUP_CACHE_BACKEND=%s, using default memory", backend
+        )
+        return "memory"
+    return backend
+
+
+def get_curation_lookup_cache_ttl_seconds() -> float:
+    """Seconds a cached lookup result stays valid (CURATION_LOOKUP_CACHE_TTL_SECONDS).
+
+    Bounds staleness after curation-DB loads. Default 3600.
+    """
+    return max(1.0, _get_env_float_with_fallback("CURATION_LOOKUP_CACHE_TTL_SECONDS", 3600.0))
+
+
+def get_curation_lookup_cache_max_entries() -> int:
+    """In-process lookup cache capacity before LRU eviction (CURATION_LOOKUP_CACHE_MAX_ENTRIES).
+
+    Default 2048.
+    """
+    return max(1, _get_env_int_with_fallback("CURATION_LOOKUP_CACHE_MAX_ENTRIES", 2048))
+
+
 def get_agent_studio_trace_tool_timeout_seconds() -> float:
     """HTTP timeout for heavy Agent Studio trace tool calls (AGENT_STUDIO_TRACE_TOOL_TIMEOUT_SECONDS).
 
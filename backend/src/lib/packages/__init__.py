@@ -82,6 +82,12 @@ from .package_runner import (
     PackageToolRunner,
     execute_package_tool,
 )
+from .worker_pool import (
+    PackageWorkerError,
+    PackageWorkerPool,
+    PackageWorkerReply,
+    PackageWorkerTimeoutError,
+)
 from .paths import (
     get_file_output_dir,
     get_identifier_prefix_file_path,
@@ -116,11 +122,14 @@ from .runner_protocol import (
     RunnerProtocolError,
     RunnerRequest,
     RunnerSuccessResponse,
+    RunnerWorkerFrame,
     decode_request,
     decode_response,
+    decode_worker_frame,
     encode_error_response,
     encode_request,
     encode_success_response,
+    encode_worker_frame,
 )
 from .tool_bindings_loader import (
     LoadedToolBindingExport,
@@ -178,12 +187,17 @@ __all__ = [
     "PackageRegistryValidationError",
     "PackageToolExecutionResult",
     "PackageToolRunner",
+    "PackageWorkerError",
+    "PackageWorkerPool",
+    "PackageWorkerReply",
+    "PackageWorkerTimeoutError",
     "RegisteredToolBinding",
     "RunnerError",
     "RunnerErrorResponse",
     "RunnerProtocolError",
     "RunnerRequest",
     "RunnerSuccessResponse",
+    "RunnerWorkerFrame",
     "RuntimeOverrideSelection",
     "RuntimeOverrides",
     "RuntimeOverridesError",
@@ -203,10 +217,12 @@ __all__ = [
     "build_tool_registry",
     "decode_request",
     "decode_response",
+    "decode_worker_frame",
     "discover_package_manifests",
     "encode_error_response",
     "encode_request",
     "encode_success_response",
+    "encode_worker_frame",
     "execute_package_tool",
     "extend_sys_path_for_package",
     "get_file_output_dir",
@@ -1,13 +1,20 @@
-"""Subprocess package tool runner backed by per-package virtual environments."""
+"""Subprocess package tool runner backed by per-package virtual environments.
+
+By default every call starts a fresh interpreter. When
+PACKAGE_RUNNER_WORKER_POOL_ENABLED is set, calls are served by a process-wide
+pool of warm ``--worker`` interpreters per package environment instead.
+"""
 
 from __future__ import annotations
 
 import subprocess
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
 from .env_manager import (
+    PackageEnvironment,
     PackageEnvironmentBootstrapError,
     PackageEnvironmentManager,
 )
@@ -19,6 +26,17 @@ from .runner_protocol import (
     encode_request,
 )
 from .tool_registry import ToolRegistry, load_tool_registry
+from .worker_pool import (
+    PackageWorkerError,
+    PackageWorkerPool,
+    PackageWorkerTimeoutError,
+)
+
+_DEFAULT_ENTRYPOINT_PATH = Path(__file__).resolve(strict=False).with_name(
+    "package_runner_entrypoint.py"
+)
+_shared_worker_pool: PackageWorkerPool | None = None
+_shared_worker_pool_lock = threading.Lock()
 
 
 @dataclass(frozen=True)
@@ -40,6 +58,8 @@ class PackageToolExecutionResult:
     stdout: str = ""
     stderr: str = ""
     environment_reused: bool | None = None
+    queue_wait_seconds: float | None = None
+    execution_seconds: float | None = None
 
 
 class PackageToolRunner:
@@ -52,15 +72,11 @@ class PackageToolRunner:
         env_manager: PackageEnvironmentManager | None = None,
         entrypoint_path: Path | None = None,
         timeout_seconds: float | None = None,
+        worker_pool: PackageWorkerPool | None = None,
     ) -> None:
         self._tool_registry = tool_registry or load_tool_registry()
         self._env_manager = env_manager or PackageEnvironmentManager()
-        self._entrypoint_path = (
-            entrypoint_path
-            or Path(__file__).resolve(strict=False).with_name(
-                "package_runner_entrypoint.py"
-            )
-        )
+        self._entrypoint_path = entrypoint_path or _DEFAULT_ENTRYPOINT_PATH
         # Wall-clock budget for one package tool subprocess. Env-configurable via
         # PACKAGE_RUNNER_TIMEOUT_SECONDS (default 60); see config.py / .env.example.
         if timeout_seconds is None:
@@ -70,6 +86,9 @@ class PackageToolRunner:
 
             timeout_seconds = get_package_runner_timeout_seconds()
         self._timeout_seconds = timeout_seconds
+        if worker_pool is None and entrypoint_path is None:
+            worker_pool = get_shared_package_worker_pool()
+        self._worker_pool = worker_pool
 
     def execute_tool(
         self,
@@ -130,6 +149,9 @@ class PackageToolRunner:
             kwargs=dict(kwargs or {}),
         )
 
+        if self._worker_pool is not None:
+            return self._execute_in_worker(tool_id, request, environment)
+
         try:
             completed = subprocess.run(
                 [str(environment.python_executable), str(self._entrypoint_path)],
@@ -140,75 +162,190 @@ class PackageToolRunner:
                 timeout=self._timeout_seconds,
             )
         except subprocess.TimeoutExpired:
-            return PackageToolExecutionResult(
-                ok=False,
-                error=PackageRunnerError(
-                    code="execution_failure",
-                    message=f"Timed out while executing package tool '{tool_id}'",
-                    details={"timeout_seconds": self._timeout_seconds},
-                ),
-                environment_reused=environment.reused,
-            )
+            return self._timeout_result(tool_id, environment_reused=environment.reused)
+
+        return _interpret_runner_output(
+            completed.stdout,
+            stdout=completed.stdout,
+            stderr=completed.stderr,
+            returncode=completed.returncode,
+            environment_reused=environment.reused,
+        )
 
+    def _execute_in_worker(
+        self,
+        tool_id: str,
+        request: RunnerRequest,
+        environment: PackageEnvironment,
+    ) -> PackageToolExecutionResult:
+        """Run one request on a warm pooled worker instead of a fresh subprocess."""
+        assert self._worker_pool is not None
         try:
-            response = decode_response(completed.stdout)
-        except ValueError as exc:
+            reply = self._worker_pool.execute(
+                package_id=request.package_id,
+                package_version=request.package_version,
+                python_executable=environment.python_executable,
+                payload=encode_request(request),
+                timeout_seconds=self._timeout_seconds,
+            )
+        except PackageWorkerTimeoutError:
+            return self._timeout_result(tool_id, environment_reused=environment.reused)
+        except PackageWorkerError as exc:
             return PackageToolExecutionResult(
                 ok=False,
                 error=PackageRunnerError(
                     code="bad_runner_response",
                     message=str(exc),
-                    details={
-                        "returncode": completed.returncode,
-                        "stdout": completed.stdout.strip(),
-                        "stderr": completed.stderr.strip(),
-                    },
+                    details=exc.details,
                 ),
-                stdout=completed.stdout,
-                stderr=completed.stderr,
                 environment_reused=environment.reused,
             )
 
-        if isinstance(response, RunnerErrorResponse):
-            return PackageToolExecutionResult(
-                ok=False,
-                error=PackageRunnerError(
-                    code=response.error.code,
-                    message=response.error.message,
-                    details=response.error.details,
-                ),
-                stdout=completed.stdout,
-                stderr=completed.stderr,
-                environment_reused=environment.reused,
-            )
+        # Worker stdout/stderr are what the tool itself printed; the protocol
+        # payload travels separately inside the worker frame.
+        return _interpret_runner_output(
+            reply.response,
+            stdout=reply.stdout,
+            stderr=reply.stderr,
+            returncode=0,
+            environment_reused=environment.reused,
+            queue_wait_seconds=reply.queue_wait_seconds,
+            execution_seconds=reply.execution_seconds,
+        )
+
+    def _timeout_result(
+        self,
+        tool_id: str,
+        *,
+        environment_reused: bool,
+    ) -> PackageToolExecutionResult:
+        return PackageToolExecutionResult(
+            ok=False,
+            error=PackageRunnerError(
+                code="execution_failure",
+                message=f"Timed out while executing package tool '{tool_id}'",
+                details={"timeout_seconds": self._timeout_seconds},
+            ),
+            environment_reused=environment_reused,
+        )
 
-        if completed.returncode != 0:
-            return PackageToolExecutionResult(
-                ok=False,
-                error=PackageRunnerError(
-                    code="bad_runner_response",
-                    message=(
-                        f"Runner exited with code {completed.returncode} despite success payload"
-                    ),
-                    details={
-                        "returncode": completed.returncode,
-                        "stdout": completed.stdout.strip(),
-                        "stderr": completed.stderr.strip(),
-                    },
-                ),
-                stdout=completed.stdout,
-                stderr=completed.stderr,
-                environment_reused=environment.reused,
-            )
 
+def _interpret_runner_output(
+    payload: str,
+    *,
+    stdout: str,
+    stderr: str,
+    returncode: int,
+    environment_reused: bool,
+    queue_wait_seconds: float | None = None,
+    execution_seconds: float | None = None,
+) -> PackageToolExecutionResult:
+    """Translate one encoded runner response into a structured execution result."""
+    timings = {
+        "queue_wait_seconds": queue_wait_seconds,
+        "execution_seconds": execution_seconds,
+    }
+    try:
+        response = decode_response(payload)
+    except ValueError as exc:
         return PackageToolExecutionResult(
-            ok=True,
-            result=response.result,
-            stdout=completed.stdout,
-            stderr=completed.stderr,
-            environment_reused=environment.reused,
+            ok=False,
+            error=PackageRunnerError(
+                code="bad_runner_response",
+                message=str(exc),
+                details={
+                    "returncode": returncode,
+                    "stdout": payload.strip(),
+                    "stderr": stderr.strip(),
+                },
+            ),
+            stdout=stdout,
+            stderr=stderr,
+            environment_reused=environment_reused,
+            **timings,
+        )
+
+    if isinstance(response, RunnerErrorResponse):
+        return PackageToolExecutionResult(
+            ok=False,
+            error=PackageRunnerError(
+                code=response.error.code,
+                message=response.error.message,
+                details=response.error.details,
+            ),
+            stdout=stdout,
+            stderr=stderr,
+            environment_reused=environment_reused,
+            **timings,
+        )
+
+    if returncode != 0:
+        return PackageToolExecutionResult(
+            ok=False,
+            error=PackageRunnerError(
+                code="bad_runner_response",
+                message=(
+                    f"Runner exited with code {returncode} despite success payload"
+                ),
+                details={
+                    "returncode": returncode,
+                    "stdout": payload.strip(),
+                    "stderr": stderr.strip(),
+                },
+            ),
+            stdout=stdout,
+            stderr=stderr,
+            environment_reused=environment_reused,
+            **timings,
         )
 
+    return PackageToolExecutionResult(
+        ok=True,
+        result=response.result,
+        stdout=stdout,
+        stderr=stderr,
+        environment_reused=environment_reused,
+        **timings,
+    )
+
+
+def get_shared_package_worker_pool() -> PackageWorkerPool | None:
+    """Return the process-wide warm worker pool, or None when pooling is disabled."""
+    global _shared_worker_pool
+
+    from src.lib.openai_agents.config import (
+        get_package_runner_worker_max_requests,
+        get_package_runner_worker_pool_enabled,
+        get_package_runner_worker_pool_size,
+    )
+
+    if not get_package_runner_worker_pool_enabled():
+        return None
+    with _shared_worker_pool_lock:
+        if _shared_worker_pool is None:
+            _shared_worker_pool = PackageWorkerPool(
+                entrypoint_path=_DEFAULT_ENTRYPOINT_PATH,
+                pool_size=get_package_runner_worker_pool_size(),
+                max_requests_per_worker=get_package_runner_worker_max_requests(),
+            )
+        return _shared_worker_pool
+
+
+def get_package_worker_pool_metrics() -> dict[str, Any] | None:
+    """Return warm worker pool metrics if the shared pool has been created."""
+    pool = _shared_worker_pool
+    return pool.metrics_snapshot() if pool is not None else None
+
+
+def shutdown_shared_package_worker_pool() -> None:
+    """Stop the process-wide warm worker pool (used on app shutdown and in tests)."""
+    global _shared_worker_pool
+
+    with _shared_worker_pool_lock:
+        pool, _shared_worker_pool = _shared_worker_pool, None
+    if pool is not None:
+        pool.close()
+
 
 def execute_package_tool(
     tool_id: str,
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import importlib
 import inspect
+import io
 import json
 import os
 import sys
@@ -18,32 +20,78 @@ HOST_RUNTIME_SRC_DIR = CURRENT_DIR.parent.parent
 HOST_RUNTIME_ROOT_DIR = HOST_RUNTIME_SRC_DIR.parent
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     # Package tool calls already run in an isolated subprocess, so downstream
     # helpers can safely skip extra worker-thread offloading.
     os.environ["AGR_AI_CURATION_PACKAGE_TOOL_SUBPROCESS"] = "1"
     protocol = _load_runner_protocol()
+    arguments = sys.argv[1:] if argv is None else argv
+    if "--worker" in arguments:
+        return _serve_worker(protocol)
+
+    response, exit_code = _handle_request(protocol, sys.stdin.read())
+    sys.stdout.write(response)
+    return exit_code
+
+
+def _serve_worker(protocol: dict[str, Any]) -> int:
+    """Answer newline-delimited requests until stdin closes.
+
+    The protocol channel is the original stdout; anything the tool itself
+    prints is captured per request and returned inside the worker frame so it
+    can never corrupt the framing.
+    """
+    channel = sys.stdout
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        captured_stdout = io.StringIO()
+        captured_stderr = io.StringIO()
+        with contextlib.redirect_stdout(captured_stdout), contextlib.redirect_stderr(
+            captured_stderr
+        ):
+            response, _exit_code = _handle_request(protocol, line, reset_context=True)
+        channel.write(
+            protocol["encode_worker_frame"](
+                protocol["RunnerWorkerFrame"](
+                    response=response,
+                    stdout=captured_stdout.getvalue(),
+                    stderr=captured_stderr.getvalue(),
+                )
+            )
+            + "\n"
+        )
+        channel.flush()
+    return 0
+
+
+def _handle_request(
+    protocol: dict[str, Any],
+    payload: str,
+    *,
+    reset_context: bool = False,
+) -> tuple[str, int]:
+    """Execute one encoded request and return the encoded response and exit code."""
     try:
-        request = protocol["decode_request"](sys.stdin.read())
+        request = protocol["decode_request"](payload)
         _extend_sys_path(request)
-        _apply_backend_request_context(request.context)
+        _apply_backend_request_context(request.context, reset=reset_context)
         tool_target = _resolve_tool_target(request)
         result = _normalize_result(_execute_tool_target(tool_target, request))
         json.dumps(result)
-        sys.stdout.write(protocol["encode_success_response"](result))
-        return 0
+        return protocol["encode_success_response"](result), 0
     except protocol["RunnerProtocolError"] as exc:
-        sys.stdout.write(
+        return (
             protocol["encode_error_response"](
                 protocol["RunnerError"](
                     code="invalid_request",
                     message=str(exc),
                 )
-            )
+            ),
+            1,
         )
-        return 1
     except (ImportError, AttributeError) as exc:
-        sys.stdout.write(
+        return (
             protocol["encode_error_response"](
                 protocol["RunnerError"](
                     code="import_failure",
@@ -53,11 +101,11 @@ def main() -> int:
                         "traceback": traceback.format_exc(),
                     },
                 )
-            )
+            ),
+            1,
         )
-        return 1
     except Exception as exc:  # pragma: no cover - exercised via subprocess tests
-        sys.stdout.write(
+        return (
             protocol["encode_error_response"](
                 protocol["RunnerError"](
                     code="execution_failure",
@@ -67,9 +115,9 @@ def main() -> int:
                         "traceback": traceback.format_exc(),
                     },
                 )
-            )
+            ),
+            1,
         )
-        return 1
 
 
 def _load_runner_protocol() -> dict[str, Any]:
@@ -79,17 +127,21 @@ def _load_runner_protocol() -> dict[str, Any]:
     from runner_protocol import (  # type: ignore[import-not-found]
         RunnerError,
         RunnerProtocolError,
+        RunnerWorkerFrame,
         decode_request,
         encode_error_response,
         encode_success_response,
+        encode_worker_frame,
     )
 
     return {
         "RunnerError": RunnerError,
         "RunnerProtocolError": RunnerProtocolError,
+        "RunnerWorkerFrame": RunnerWorkerFrame,
         "decode_request": decode_request,
         "encode_error_response": encode_error_response,
         "encode_success_response": encode_success_response,
+        "encode_worker_frame": encode_worker_frame,
     }
 
 
@@ -130,16 +182,21 @@ def _normalize_context_value(value: Any) -> str | None:
     return text or None
 
 
-def _apply_backend_request_context(context: dict[str, Any]) -> None:
+def _apply_backend_request_context(
+    context: dict[str, Any],
+    *,
+    reset: bool = False,
+) -> None:
     """Hydrate backend request context inside the package subprocess.
 
-    Static package tools execute in a fresh subprocess, so they cannot see the
-    host process contextvars directly. Re-apply the request metadata here so
+    Static package tools execute in a separate subprocess, so they cannot see
+    the host process contextvars directly. Re-apply the request metadata here so
     runtime helpers such as file output persistence behave the same way they do
-    in host-process execution paths.
+    in host-process execution paths. Warm workers pass ``reset=True`` so the
+    previous call's context is cleared even when this request carries none.
     """
 
-    if not context:
+    if not context and not reset:
         return
 
     try:
@@ -188,8 +245,8 @@ def _execute_tool_target(target: Any, request) -> Any:
     else:
         result = target(*request.args, **request.kwargs)
 
-    # This entrypoint always runs in a fresh subprocess, so asyncio.run() is the
-    # correct way to drive async tool objects without relying on a shared loop.
+    # The entrypoint never runs an event loop of its own (one-shot or warm
+    # worker), so asyncio.run() drives each async tool call on a fresh loop.
     if inspect.isawaitable(result):
         return asyncio.run(result)
     return result
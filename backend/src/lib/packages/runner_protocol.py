@@ -1,4 +1,10 @@
-"""JSON stdin/stdout protocol for isolated package tool execution."""
+"""JSON stdin/stdout protocol for isolated package tool execution.
+
+One-shot runners read a single request from stdin and write a single response
+to stdout. Warm workers (``--worker``) read newline-delimited requests and
+answer each with one newline-delimited worker frame that wraps the same
+response payload together with the tool's captured stdout/stderr.
+"""
 
 from __future__ import annotations
 
@@ -57,6 +63,15 @@ class RunnerErrorResponse:
     error: RunnerError
 
 
+@dataclass(frozen=True)
+class RunnerWorkerFrame:
+    """One warm-worker reply: the encoded response plus captured tool output."""
+
+    response: str
+    stdout: str = ""
+    stderr: str = ""
+
+
 def encode_request(request: RunnerRequest) -> str:
     """Serialize one execution request to JSON."""
     return json.dumps(asdict(request), sort_keys=True)
@@ -136,6 +151,24 @@ def decode_response(payload: str) -> RunnerSuccessResponse | RunnerErrorResponse
     )
 
 
+def encode_worker_frame(frame: RunnerWorkerFrame) -> str:
+    """Serialize one warm-worker reply as a single JSON line."""
+    return json.dumps(asdict(frame), sort_keys=True)
+
+
+def decode_worker_frame(payload: str) -> RunnerWorkerFrame:
+    """Parse and validate one warm-worker reply line."""
+    data = _decode_mapping(payload, expected_type="worker frame")
+    response = data.get("response")
+    if not isinstance(response, str) or not response:
+        raise RunnerProtocolError("frame.response must be a non-empty string")
+    stdout = data.get("stdout", "")
+    stderr = data.get("stderr", "")
+    if not isinstance(stdout, str) or not isinstance(stderr, str):
+        raise RunnerProtocolError("frame.stdout and frame.stderr must be strings")
+    return RunnerWorkerFrame(response=response, stdout=stdout, stderr=stderr)
+
+
 def _decode_mapping(payload: str, *, expected_type: str) -> dict[str, Any]:
     try:
         data = json.loads(payload)
@@ -0,0 +1,346 @@
+"""Warm, reusable package tool worker processes.
+
+Each pooled worker is a long-lived ``package_runner_entrypoint.py --worker``
+interpreter inside one package's virtual environment. Requests and replies use
+the ``runner_protocol`` JSON encoding, one line per message, so a worker pays
+Python startup and package imports once and then serves many tool calls.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .runner_protocol import RunnerProtocolError, decode_worker_frame
+
+logger = logging.getLogger(__name__)
+
+_WORKER_EXITED = object()
+
+
+class PackageWorkerError(RuntimeError):
+    """Raised when a pooled worker cannot complete one request."""
+
+    def __init__(self, message: str, *, details: dict[str, Any] | None = None) -> None:
+        super().__init__(message)
+        self.details = details or {}
+
+
+class PackageWorkerTimeoutError(PackageWorkerError):
+    """Raised when a pooled worker exceeds the per-call timeout."""
+
+
+@dataclass(frozen=True)
+class PackageWorkerReply:
+    """One decoded worker reply plus pool timing for the call."""
+
+    response: str
+    stdout: str
+    stderr: str
+    queue_wait_seconds: float
+    execution_seconds: float
+    worker_reused: bool
+
+
+@dataclass
+class _PoolMetrics:
+    calls: int = 0
+    spawns: int = 0
+    recycles: int = 0
+    timeouts: int = 0
+    crashes: int = 0
+    queue_wait_seconds_total: float = 0.0
+    queue_wait_seconds_max: float = 0.0
+    execution_seconds_total: float = 0.0
+    execution_seconds_max: float = 0.0
+
+
+class _PackageWorker:
+    """One warm worker process and the thread that drains its replies."""
+
+    def __init__(self, python_executable: Path, entrypoint_path: Path) -> None:
+        self.process = subprocess.Popen(
+            [str(python_executable), str(entrypoint_path), "--worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            # Interpreter-level noise (warnings, C extensions) goes to the host
+            # log stream; tool output is captured inside the worker frame.
+            stderr=None,
+            text=True,
+            bufsize=1,
+        )
+        self.requests_served = 0
+        self._replies: queue.Queue[Any] = queue.Queue()
+        self._reader = threading.Thread(
+            target=self._drain_stdout,
+            name=f"package-worker-{self.process.pid}",
+            daemon=True,
+        )
+        self._reader.start()
+
+    def _drain_stdout(self) -> None:
+        stdout = self.process.stdout
+        assert stdout is not None
+        for line in stdout:
+            self._replies.put(line)
+        self._replies.put(_WORKER_EXITED)
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def call(self, payload: str, *, timeout_seconds: float) -> str:
+        stdin = self.process.stdin
+        assert stdin is not None
+        try:
+            stdin.write(payload + "\n")
+            stdin.flush()
+        except (BrokenPipeError, OSError) as exc:
+            raise PackageWorkerError(
+                "Package worker exited before accepting the request",
+                details={"returncode": self.process.poll(), "error": str(exc)},
+            ) from exc
+
+        try:
+            line = self._replies.get(timeout=timeout_seconds)
+        except queue.Empty as exc:
+            raise PackageWorkerTimeoutError(
+                "Package worker timed out",
+                details={"timeout_seconds": timeout_seconds},
+            ) from exc
+        if line is _WORKER_EXITED:
+            raise PackageWorkerError(
+                "Package worker exited before replying",
+                details={"returncode": self.process.wait()},
+            )
+        self.requests_served += 1
+        return line
+
+    def terminate(self) -> None:
+        if self.alive:
+            try:
+                if self.process.stdin is not None:
+                    self.process.stdin.close()
+                self.process.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+
+    def kill(self) -> None:
+        if self.alive:
+            self.process.kill()
+        self.process.wait()
+
+
+class _WorkerGroup:
+    """Bounded set of warm workers for one package environment."""
+
+    def __init__(self, size: int) -> None:
+        self.slots = threading.BoundedSemaphore(size)
+        self.idle: list[_PackageWorker] = []
+        self.lock = threading.Lock()
+
+
+class PackageWorkerPool:
+    """Per-package-environment pool of warm package tool workers."""
+
+    def __init__(
+        self,
+        *,
+        entrypoint_path: Path,
+        pool_size: int = 2,
+        max_requests_per_worker: int = 200,
+    ) -> None:
+        self._entrypoint_path = entrypoint_path
+        self._pool_size = max(1, pool_size)
+        self._max_requests_per_worker = max(1, max_requests_per_worker)
+        self._groups: dict[tuple[str, str, str], _WorkerGroup] = {}
+        self._groups_lock = threading.Lock()
+        self._metrics = _PoolMetrics()
+        self._metrics_lock = threading.Lock()
+
+    def execute(
+        self,
+        *,
+        package_id: str,
+        package_version: str,
+        python_executable: Path,
+        payload: str,
+        timeout_seconds: float,
+    ) -> PackageWorkerReply:
+        """Send one encoded ``RunnerRequest`` to a warm worker and return its reply.
+
+        Waiting for a free worker counts against ``timeout_seconds`` as well, so
+        the caller's wall-clock budget matches the one-shot subprocess path.
+        """
+        group = self._group_for(package_id, package_version, python_executable)
+        queued_at = time.monotonic()
+        if not group.slots.acquire(timeout=timeout_seconds):
+            self._record(timeouts=1)
+            raise PackageWorkerTimeoutError(
+                "Timed out waiting for a free package worker",
+                details={"timeout_seconds": timeout_seconds, "pool_size": self._pool_size},
+            )
+
+        worker: _PackageWorker | None = None
+        try:
+            queue_wait = time.monotonic() - queued_at
+            worker, reused = self._checkout(group, python_executable)
+            started_at = time.monotonic()
+            try:
+                line = worker.call(
+                    payload,
+                    timeout_seconds=max(0.001, timeout_seconds - queue_wait),
+                )
+            except PackageWorkerTimeoutError:
+                # Only the stuck worker is replaced; its siblings keep serving.
+                worker.kill()
+                worker = None
+                self._record(timeouts=1)
+                raise
+            except PackageWorkerError:
+                worker.kill()
+                worker = None
+                self._record(crashes=1)
+                raise
+            execution = time.monotonic() - started_at
+
+            try:
+                frame = decode_worker_frame(line)
+            except RunnerProtocolError as exc:
+                worker.kill()
+                worker = None
+                self._record(crashes=1)
+                raise PackageWorkerError(str(exc), details={"stdout": line.strip()}) from exc
+
+            self._record(calls=1, queue_wait=queue_wait, execution=execution)
+            return PackageWorkerReply(
+                response=frame.response,
+                stdout=frame.stdout,
+                stderr=frame.stderr,
+                queue_wait_seconds=queue_wait,
+                execution_seconds=execution,
+                worker_reused=reused,
+            )
+        finally:
+            if worker is not None:
+                self._checkin(group, worker)
+            group.slots.release()
+
+    def metrics_snapshot(self) -> dict[str, Any]:
+        """Return cumulative pool counters and queue-wait vs execution timings."""
+        with self._metrics_lock:
+            metrics = self._metrics
+            calls = metrics.calls
+            snapshot = {
+                "pool_size": self._pool_size,
+                "max_requests_per_worker": self._max_requests_per_worker,
+                "calls": calls,
+                "spawns": metrics.spawns,
+                "recycles": metrics.recycles,
+                "timeouts": metrics.timeouts,
+                "crashes": metrics.crashes,
+                "queue_wait_ms_avg": (
+                    metrics.queue_wait_seconds_total / calls * 1000 if calls else 0.0
+                ),
+                "queue_wait_ms_max": metrics.queue_wait_seconds_max * 1000,
+                "execution_ms_avg": (
+                    metrics.execution_seconds_total / calls * 1000 if calls else 0.0
+                ),
+                "execution_ms_max": metrics.execution_seconds_max * 1000,
+            }
+        with self._groups_lock:
+            snapshot["idle_workers"] = {
+                f"{key[0]}@{key[1]}": len(group.idle) for key, group in self._groups.items()
+            }
+        return snapshot
+
+    def close(self) -> None:
+        """Stop every idle worker. Busy workers are stopped when checked back in."""
+        with self._groups_lock:
+            groups = list(self._groups.values())
+            self._groups.clear()
+        for group in groups:
+            with group.lock:
+                idle, group.idle = group.idle, []
+            for worker in idle:
+                worker.terminate()
+
+    def _group_for(
+        self,
+        package_id: str,
+        package_version: str,
+        python_executable: Path,
+    ) -> _WorkerGroup:
+        key = (package_id, package_version, str(python_executable))
+        with self._groups_lock:
+            group = self._groups.get(key)
+            if group is None:
+                group = _WorkerGroup(self._pool_size)
+                self._groups[key] = group
+            return group
+
+    def _checkout(
+        self,
+        group: _WorkerGroup,
+        python_executable: Path,
+    ) -> tuple[_PackageWorker, bool]:
+        with group.lock:
+            while group.idle:
+                worker = group.idle.pop()
+                if worker.alive:
+                    return worker, True
+                self._record(crashes=1)
+        worker = _PackageWorker(python_executable, self._entrypoint_path)
+        self._record(spawns=1)
+        logger.debug(
+            "Spawned package worker pid=%s python=%s",
+            worker.process.pid,
+            python_executable,
+        )
+        return worker, False
+
+    def _checkin(self, group: _WorkerGroup, worker: _PackageWorker) -> None:
+        if worker.requests_served >= self._max_requests_per_worker:
+            worker.terminate()
+            self._record(recycles=1)
+            return
+        if not worker.alive:
+            self._record(crashes=1)
+            return
+        with self._groups_lock:
+            group_is_live = group in self._groups.values()
+        if not group_is_live:
+            worker.terminate()
+            return
+        with group.lock:
+            group.idle.append(worker)
+
+    def _record(
+        self,
+        *,
+        calls: int = 0,
+        spawns: int = 0,
+        recycles: int = 0,
+        timeouts: int = 0,
+        crashes: int = 0,
+        queue_wait: float = 0.0,
+        execution: float = 0.0,
+    ) -> None:
+        with self._metrics_lock:
+            metrics = self._metrics
+            metrics.calls += calls
+            metrics.spawns += spawns
+            metrics.recycles += recycles
+            metrics.timeouts += timeouts
+            metrics.crashes += crashes
+            metrics.queue_wait_seconds_total += queue_wait
+            metrics.queue_wait_seconds_max = max(metrics.queue_wait_seconds_max, queue_wait)
+            metrics.execution_seconds_total += execution
+            metrics.execution_seconds_max = max(metrics.execution_seconds_max, execution)
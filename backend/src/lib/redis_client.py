@@ -9,13 +9,21 @@ import logging
 import os
 from typing import Optional
 
+import threading
+
 import redis.asyncio as redis
+from redis import Redis as SyncRedis
 
 logger = logging.getLogger(__name__)
 
 # Global async Redis client
 _redis_client: Optional[redis.Redis] = None
 
+# Global sync Redis client for thread-pool and package-tool code paths
+_sync_redis_client: Optional[SyncRedis] = None
+_sync_redis_lock = threading.Lock()
+SYNC_REDIS_SOCKET_TIMEOUT_SECONDS = 2.0
+
 
 def get_redis_url() -> str:
     """Get Redis URL from environment."""
@@ -50,6 +58,43 @@ async def close_redis() -> None:
         await _redis_client.close()
         _redis_client = None
         logger.info("Redis connection closed")
+    close_sync_redis()
+
+
+def get_sync_redis() -> SyncRedis:
+    """Get or create the blocking Redis client.
+
+    Synchronous callers (tool functions, background threads) cannot await the
+    async client. Short socket timeouts keep a Redis outage from stalling them.
+
+    Returns:
+        Sync Redis client instance
+    """
+    global _sync_redis_client
+
+    with _sync_redis_lock:
+        if _sync_redis_client is None:
+            redis_url = get_redis_url()
+            logger.info('Connecting sync Redis client to %s', redis_url)
+            _sync_redis_client = SyncRedis.from_url(
+                redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+                socket_timeout=SYNC_REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=SYNC_REDIS_SOCKET_TIMEOUT_SECONDS,
+            )
+        return _sync_redis_client
+
+
+def close_sync_redis() -> None:
+    """Close the blocking Redis client, if one was created."""
+    global _sync_redis_client
+
+    with _sync_redis_lock:
+        if _sync_redis_client is not None:
+            _sync_redis_client.close()
+            _sync_redis_client = None
+            logger.info("Sync Redis connection closed")
 
 
 # Stream cancellation helpers
@@ -1,11 +1,100 @@
-"""MMR Diversifier for V5 Weaviate implementation."""
+"""MMR Diversifier for V5 Weaviate implementation.
+
+Candidate vectors are stacked into a single unit-normalized matrix once per
+call. Selection keeps a running ``max_sim`` vector (each candidate's highest
+cosine similarity to anything already selected) that is refreshed with one
+matrix-vector product per pick, so a pool of ``n`` candidates costs
+``O(k * n * d)`` BLAS work instead of ``O(k * n * k * d)`` Python-level
+comparisons.
+"""
 
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+def _coerce_vector(raw: Any) -> Any:
+    """Unwrap Weaviate named-vector payloads (``{"default": [...]}``) to a flat list."""
+    if isinstance(raw, dict):
+        return raw.get("default") or list(raw.values())[0]
+    return raw
+
+
+def _prepare_candidates(
+    chunks: List[Dict[str, Any]],
+    vector_field: str,
+) -> Tuple[List[Dict[str, Any]], np.ndarray, np.ndarray]:
+    """Return vector-bearing chunks, normalized relevance, and unit vector matrix."""
+    chunks_with_vectors = [c for c in chunks if vector_field in c]
+    if not chunks_with_vectors:
+        return [], np.empty(0), np.empty((0, 0))
+
+    # Normalize scores to [0,1] for consistent MMR calculation
+    scores = np.array([c.get('score', 0) for c in chunks_with_vectors], dtype=float)
+    if scores.max() > 0:
+        scores = scores / scores.max()
+
+    vectors = np.asarray(
+        [_coerce_vector(c[vector_field]) for c in chunks_with_vectors],
+        dtype=float,
+    )
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    # Zero vectors stay zero so their similarity to everything is 0, matching
+    # the epsilon-guarded pairwise cosine the original implementation used.
+    unit_vectors = vectors / np.where(norms > 0, norms, 1.0)
+    return chunks_with_vectors, scores, unit_vectors
+
+
+def select_mmr_indices(
+    relevance: np.ndarray,
+    unit_vectors: np.ndarray,
+    lambda_param: float = 0.5,
+    top_k: int = 10,
+) -> List[int]:
+    """
+    Select candidate indices by Maximal Marginal Relevance.
+
+    Args:
+        relevance: Normalized relevance score per candidate, shape ``(n,)``
+        unit_vectors: L2-normalized candidate vectors, shape ``(n, d)``
+        lambda_param: Balance (0=diversity, 1=relevance)
+        top_k: Number of indices to select
+
+    Returns:
+        Selected candidate indices in selection order
+    """
+    n = relevance.shape[0]
+    if n == 0 or top_k <= 0:
+        return []
+
+    available = np.ones(n, dtype=bool)
+    max_sim = np.zeros(n)
+    selected: List[int] = []
+
+    # First selection: highest normalized score
+    best_idx = int(np.argmax(relevance))
+    while True:
+        selected.append(best_idx)
+        available[best_idx] = False
+        if len(selected) >= top_k or not available.any():
+            break
+
+        np.maximum(max_sim, unit_vectors @ unit_vectors[best_idx], out=max_sim)
+        mmr = lambda_param * relevance - (1 - lambda_param) * max_sim
+        mmr[~available] = -np.inf
+        best_idx = int(np.argmax(mmr))
+
+    return selected
+
+
+def _strip_vector(chunk: Dict[str, Any], vector_field: str) -> Dict[str, Any]:
+    result = chunk.copy()
+    result.pop(vector_field, None)  # Remove internal vector field
+    return result
+
+
 def mmr_diversify(
     chunks: List[Dict[str, Any]],
     lambda_param: float = 0.5,
@@ -27,68 +116,118 @@ def mmr_diversify(
     if not chunks or top_k <= 0:
         return []
 
-    # Check if we have vectors
-    chunks_with_vectors = [c for c in chunks if vector_field in c]
+    chunks_with_vectors, relevance, unit_vectors = _prepare_candidates(chunks, vector_field)
     if not chunks_with_vectors:
         logger.debug("No vectors for MMR, returning top by score")
         return sorted(chunks, key=lambda x: x.get('score', 0), reverse=True)[:top_k]
 
-    # Normalize scores to [0,1] for consistent MMR calculation
-    scores = np.array([c.get('score', 0) for c in chunks_with_vectors])
-    if scores.max() > 0:
-        scores = scores / scores.max()
-
-    selected_indices = []
-    remaining_indices = list(range(len(chunks_with_vectors)))
-
-    while remaining_indices and len(selected_indices) < top_k:
-        if not selected_indices:
-            # First selection: highest normalized score
-            best_idx = np.argmax(scores[remaining_indices])
-            best_idx = remaining_indices[best_idx]
-        else:
-            # MMR selection
-            best_mmr = -float('inf')
-            best_idx = None
-
-            for idx in remaining_indices:
-                # Relevance component
-                relevance = scores[idx]
-
-                # Diversity component (max similarity to selected)
-                max_sim = 0.0
-                for sel_idx in selected_indices:
-                    vec1_raw = chunks_with_vectors[idx][vector_field]
-                    vec2_raw = chunks_with_vectors[sel_idx][vector_field]
-                    # Handle Weaviate returning vectors as dict {"default": [...]} or raw list
-                    if isinstance(vec1_raw, dict):
-                        vec1_raw = vec1_raw.get("default") or list(vec1_raw.values())[0]
-                    if isinstance(vec2_raw, dict):
-                        vec2_raw = vec2_raw.get("default") or list(vec2_raw.values())[0]
-                    vec1 = np.array(vec1_raw)
-                    vec2 = np.array(vec2_raw)
-
-                    # Cosine similarity
-                    sim = np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2) + 1e-10)
-                    max_sim = max(max_sim, sim)
-
-                # MMR score
-                mmr = lambda_param * relevance - (1 - lambda_param) * max_sim
-
-                if mmr > best_mmr:
-                    best_mmr = mmr
-                    best_idx = idx
-
-        if best_idx is not None:
-            selected_indices.append(best_idx)
-            remaining_indices.remove(best_idx)
+    selected_indices = select_mmr_indices(relevance, unit_vectors, lambda_param, top_k)
 
     # Return selected chunks without vectors
-    result = []
-    for idx in selected_indices:
-        chunk = chunks_with_vectors[idx].copy()
-        chunk.pop(vector_field, None)  # Remove internal vector field
-        result.append(chunk)
+    result = [_strip_vector(chunks_with_vectors[idx], vector_field) for idx in selected_indices]
 
     logger.debug('MMR selected %s diverse results from %s candidates', len(result), len(chunks))
-    return result
\ No newline at end of file
+    return result
+
+
+def mmr_diversify_batch(
+    chunk_groups: Sequence[List[Dict[str, Any]]],
+    lambda_param: float = 0.5,
+    top_k: int = 10,
+    vector_field: str = "_vector",
+) -> List[List[Dict[str, Any]]]:
+    """
+    Apply MMR to several independent candidate pools (one per query) at once.
+
+    Pools that carry vectors are padded into one ``(queries, n, d)`` tensor and
+    selected in lockstep with a batched matrix-vector product per step. Each
+    pool's result is identical to calling ``mmr_diversify`` on it alone.
+
+    Args:
+        chunk_groups: One list of search results per query
+        lambda_param: Balance (0=diversity, 1=relevance)
+        top_k: Number of diverse results to return per query
+        vector_field: Key where vectors are stored in chunks
+
+    Returns:
+        Diversified subset of chunks for each input group, in input order
+    """
+    results: List[Optional[List[Dict[str, Any]]]] = [None] * len(chunk_groups)
+    prepared = []
+    for group_index, chunks in enumerate(chunk_groups):
+        if not chunks or top_k <= 0:
+            results[group_index] = []
+            continue
+        chunks_with_vectors, relevance, unit_vectors = _prepare_candidates(chunks, vector_field)
+        if not chunks_with_vectors:
+            results[group_index] = mmr_diversify(chunks, lambda_param, top_k, vector_field)
+            continue
+        prepared.append((group_index, chunks_with_vectors, relevance, unit_vectors))
+
+    if prepared:
+        dims = {entry[3].shape[1] for entry in prepared}
+        if len(dims) > 1:
+            # Mixed embedding sizes cannot share one tensor; fall back per pool.
+            for group_index, chunks_with_vectors, relevance, unit_vectors in prepared:
+                selected = select_mmr_indices(relevance, unit_vectors, lambda_param, top_k)
+                results[group_index] = [
+                    _strip_vector(chunks_with_vectors[idx], vector_field) for idx in selected
+                ]
+        else:
+            for (group_index, chunks_with_vectors, _, _), selected in zip(
+                prepared,
+                _select_mmr_indices_batched(
+                    [entry[2] for entry in prepared],
+                    [entry[3] for entry in prepared],
+                    lambda_param,
+                    top_k,
+                ),
+            ):
+                results[group_index] = [
+                    _strip_vector(chunks_with_vectors[idx], vector_field) for idx in selected
+                ]
+
+    logger.debug('MMR batch diversified %s candidate pools', len(chunk_groups))
+    return [group if group is not None else [] for group in results]
+
+
+def _select_mmr_indices_batched(
+    relevances: Sequence[np.ndarray],
+    unit_vector_sets: Sequence[np.ndarray],
+    lambda_param: float,
+    top_k: int,
+) -> List[List[int]]:
+    batch = len(relevances)
+    width = max(r.shape[0] for r in relevances)
+    dim = unit_vector_sets[0].shape[1]
+
+    relevance = np.zeros((batch, width))
+    vectors = np.zeros((batch, width, dim))
+    available = np.zeros((batch, width), dtype=bool)
+    for row, (rel, vecs) in enumerate(zip(relevances, unit_vector_sets)):
+        relevance[row, : rel.shape[0]] = rel
+        vectors[row, : rel.shape[0]] = vecs
+        available[row, : rel.shape[0]] = True
+
+    rows = np.arange(batch)
+    max_sim = np.zeros((batch, width))
+    selected: List[List[int]] = [[] for _ in range(batch)]
+
+    # First selection: highest normalized score per pool
+    best = np.argmax(np.where(available, relevance, -np.inf), axis=1)
+    active = np.ones(batch, dtype=bool)
+    for step in range(top_k):
+        for row in np.flatnonzero(active):
+            selected[row].append(int(best[row]))
+        available[rows[active], best[active]] = False
+        active &= available.any(axis=1)
+        if step + 1 >= top_k or not active.any():
+            break
+
+        chosen = vectors[rows, best]
+        np.maximum(max_sim, np.einsum('bnd,bd->bn', vectors, chosen), out=max_sim)
+        mmr = lambda_param * relevance - (1 - lambda_param) * max_sim
+        mmr[~available] = -np.inf
+        best = np.argmax(mmr, axis=1)
+
+    return selected
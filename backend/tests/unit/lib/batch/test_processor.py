@@ -4,9 +4,11 @@ import asyncio
 from contextlib import contextmanager
 from datetime import datetime, timezone
 import logging
+import threading
+import time
 from types import SimpleNamespace
 from typing import Any
-from uuid import uuid4
+from uuid import UUID, uuid4
 from unittest.mock import Mock
 
 import pytest
@@ -346,6 +348,9 @@ class _DummyDB:
     def refresh(self, _obj, **_kwargs):
         return None
 
+    def expire_all(self):
+        return None
+
     def commit(self):
         self.commit_calls += 1
 
@@ -1021,3 +1026,142 @@ def test_validate_file_ownership_fails_closed_on_session_error(monkeypatch):
     monkeypatch.setattr(processor, "SessionLocal", _raise_session_local)
 
     assert processor._validate_file_ownership("file-id", "auth-sub") is False
+
+
+class _MultiDocumentDB(_DummyDB):
+    def get(self, model, identifier):
+        if model is processor.BatchDocument:
+            return next(
+                (document for document in self.batch.documents if document.id == identifier),
+                None,
+            )
+        if model is processor.CurationFlow:
+            return self.flow
+        return super().get(model, identifier)
+
+
+def _build_multi_document_batch(count: int) -> tuple[Any, Any, UUID]:
+    batch, first_document, _flow = _build_batch_context()
+    documents = [first_document]
+    for position in range(1, count):
+        documents.append(
+            SimpleNamespace(**{**vars(first_document), "id": uuid4(), "document_id": uuid4(), "position": position})
+        )
+    batch.documents = documents
+    batch.total_documents = count
+    lease_owner = uuid4()
+    batch.lease_owner = lease_owner
+    batch.lease_expires_at = datetime.max.replace(tzinfo=timezone.utc)
+    flow = SimpleNamespace(id=uuid4(), name="Batch Flow")
+    batch.flow_id = flow.id
+    db = _MultiDocumentDB(
+        batch=batch,
+        batch_doc=first_document,
+        flow=flow,
+        user=SimpleNamespace(id=batch.user_id, auth_sub="auth-sub"),
+    )
+    return db, flow, lease_owner
+
+
+def test_concurrent_batch_overlaps_documents_and_keeps_counters(monkeypatch):
+    db, flow, lease_owner = _build_multi_document_batch(4)
+    batch = db.batch
+    monkeypatch.setenv("BATCH_DOCUMENT_CONCURRENCY", "4")
+    monkeypatch.setattr(processor, "_global_document_slots", None)
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+    sessions_opened = 0
+
+    @contextmanager
+    def _fake_get_db_session():
+        nonlocal sessions_opened
+        with lock:
+            sessions_opened += 1
+        yield db
+
+    def process_document(_db, _batch, document, _flow, _sub, **_kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        if document.position == 2:
+            raise RuntimeError("flow exploded")
+        document.status = BatchDocumentStatus.COMPLETED
+        BatchService(_db).recompute_batch_counters(_batch)
+
+    monkeypatch.setattr(processor, "get_db_session", _fake_get_db_session)
+    monkeypatch.setattr(processor, "_process_single_document", process_document)
+    monkeypatch.setattr(processor, "_report_document_failure", lambda *_args: None)
+
+    processor._process_claimed_batch(db, BatchService(db), batch, lease_owner)
+
+    assert peak > 1
+    assert sessions_opened == 4
+    assert batch.completed_documents == 3
+    assert batch.failed_documents == 1
+    assert batch.documents[2].error_message == "flow exploded"
+    assert batch.status == BatchStatus.COMPLETED
+
+
+def test_concurrent_batch_respects_global_document_limit(monkeypatch):
+    db, flow, lease_owner = _build_multi_document_batch(4)
+    monkeypatch.setenv("BATCH_DOCUMENT_CONCURRENCY", "4")
+    monkeypatch.setattr(processor, "_global_document_slots", threading.BoundedSemaphore(1))
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    @contextmanager
+    def _fake_get_db_session():
+        yield db
+
+    def process_document(_db, _batch, document, _flow, _sub, **_kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        document.status = BatchDocumentStatus.COMPLETED
+        BatchService(_db).recompute_batch_counters(_batch)
+
+    monkeypatch.setattr(processor, "get_db_session", _fake_get_db_session)
+    monkeypatch.setattr(processor, "_process_single_document", process_document)
+
+    processor._process_claimed_batch(db, BatchService(db), db.batch, lease_owner)
+
+    assert peak == 1
+    assert db.batch.completed_documents == 4
+
+
+def test_concurrent_batch_stops_scheduling_after_cancellation(monkeypatch):
+    db, flow, lease_owner = _build_multi_document_batch(5)
+    monkeypatch.setenv("BATCH_DOCUMENT_CONCURRENCY", "2")
+    monkeypatch.setattr(processor, "_global_document_slots", None)
+    processed: list[int] = []
+
+    @contextmanager
+    def _fake_get_db_session():
+        yield db
+
+    def process_document(_db, batch, document, _flow, _sub, **_kwargs):
+        processed.append(document.position)
+        if document.position == 0:
+            batch.status = BatchStatus.CANCELLED
+            raise processor.BatchCancelled(batch.id)
+        time.sleep(0.05)
+        document.status = BatchDocumentStatus.COMPLETED
+
+    monkeypatch.setattr(processor, "get_db_session", _fake_get_db_session)
+    monkeypatch.setattr(processor, "_process_single_document", process_document)
+
+    processor._process_claimed_batch(db, BatchService(db), db.batch, lease_owner)
+
+    # Only the document already in flight alongside the cancelled one may run.
+    assert len(processed) <= 2
+    assert db.batch.status == BatchStatus.CANCELLED
@@ -0,0 +1,170 @@
+"""Unit tests for the shared curation lookup result cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.lib.database import curation_lookup_cache
+from src.lib.database.curation_lookup_cache import (
+    CACHE_STATS_KEY,
+    CurationLookupCache,
+    build_lookup_cache_key,
+    get_curation_lookup_cache,
+    get_curation_lookup_cache_metrics,
+    reset_curation_lookup_cache,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._ops = []
+
+    def hincrby(self, key, field, amount):
+        self._ops.append((key, field, amount))
+
+    def execute(self):
+        if "pipeline" in self._redis.raise_on:
+            raise ConnectionError("redis down")
+        for key, field, amount in self._ops:
+            bucket = self._redis.hashes.setdefault(key, {})
+            bucket[field] = str(int(bucket.get(field, 0)) + amount)
+
+
+class _FakeSyncRedis:
+    def __init__(self):
+        self.store = {}
+        self.hashes = {}
+        self.setex_calls = []
+        self.raise_on = set()
+
+    def get(self, key):
+        if "get" in self.raise_on:
+            raise ConnectionError("redis down")
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        if "setex" in self.raise_on:
+            raise ConnectionError("redis down")
+        self.setex_calls.append((key, ttl))
+        self.store[key] = value
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache(monkeypatch):
+    for variable in (
+        "CURATION_LOOKUP_CACHE_ENABLED",
+        "CURATION_LOOKUP_CACHE_BACKEND",
+        "CURATION_LOOKUP_CACHE_TTL_SECONDS",
+        "CURATION_LOOKUP_CACHE_MAX_ENTRIES",
+    ):
+        monkeypatch.delenv(variable, raising=False)
+    reset_curation_lookup_cache()
+    yield
+    reset_curation_lookup_cache()
+
+
+def test_cache_key_normalizes_equivalent_arguments():
+    first = build_lookup_cache_key(
+        "search_genes",
+        {"gene_symbol": " daf-16 ", "data_provider": "WB", "limit": None},
+    )
+    second = build_lookup_cache_key("search_genes", {"data_provider": "WB", "gene_symbol": "daf-16"})
+    other_method = build_lookup_cache_key("search_alleles", {"data_provider": "WB", "gene_symbol": "daf-16"})
+
+    assert first == second
+    assert first != other_method
+    assert first.startswith("agr:lookup-cache:v1:search_genes:")
+
+
+def test_memory_cache_hits_expires_and_evicts_least_recent():
+    clock = _Clock()
+    cache = CurationLookupCache(ttl_seconds=60, max_entries=2, clock=clock)
+
+    assert cache.get("a") is None
+    cache.set("a", '{"v": 1}')
+    cache.set("b", '{"v": 2}')
+    assert cache.get("a") == '{"v": 1}'
+    cache.set("c", '{"v": 3}')
+
+    # "b" was least recently used once "a" was read.
+    assert cache.get("b") is None
+    clock.now += 61
+    assert cache.get("a") is None
+
+    metrics = cache.metrics_snapshot()
+    assert metrics["backend"] == "memory"
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 3
+    assert metrics["evictions"] == 1
+    assert metrics["expirations"] == 1
+    assert metrics["hit_ratio"] == 0.25
+
+
+def test_redis_tier_shares_entries_and_counters_between_processes():
+    redis = _FakeSyncRedis()
+    writer = CurationLookupCache(ttl_seconds=30, max_entries=8, redis_factory=lambda: redis)
+    reader = CurationLookupCache(ttl_seconds=30, max_entries=8, redis_factory=lambda: redis)
+
+    writer.set("key", "payload")
+    assert reader.get("key") == "payload"
+    # The second read is served from the reader's near cache.
+    assert reader.get("key") == "payload"
+
+    assert redis.setex_calls == [("key", 30)]
+    metrics = reader.metrics_snapshot()
+    assert metrics["backend"] == "redis"
+    assert metrics["redis_hits"] == 1
+    assert metrics["local_hits"] == 1
+    assert metrics["shared"]["stores"] == 1
+    assert metrics["shared"]["hits"] == 2
+    assert redis.hashes[CACHE_STATS_KEY]["hits"] == "2"
+
+
+def test_redis_failures_fall_back_to_local_cache():
+    redis = _FakeSyncRedis()
+    redis.raise_on.update({"get", "setex", "pipeline"})
+    cache = CurationLookupCache(ttl_seconds=30, max_entries=8, redis_factory=lambda: redis)
+
+    assert cache.get("key") is None
+    cache.set("key", "payload")
+
+    assert cache.get("key") == "payload"
+    metrics = cache.metrics_snapshot()
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 1
+    assert metrics["redis_errors"] >= 2
+
+
+def test_process_cache_follows_configuration(monkeypatch):
+    assert get_curation_lookup_cache() is None
+    assert get_curation_lookup_cache_metrics() is None
+
+    monkeypatch.setenv("CURATION_LOOKUP_CACHE_ENABLED", "true")
+    monkeypatch.setenv("CURATION_LOOKUP_CACHE_MAX_ENTRIES", "16")
+    cache = get_curation_lookup_cache()
+
+    assert cache is not None
+    assert get_curation_lookup_cache() is cache
+    assert get_curation_lookup_cache_metrics()["max_entries"] == 16
+
+    reset_curation_lookup_cache()
+    monkeypatch.setenv("CURATION_LOOKUP_CACHE_BACKEND", "redis")
+    redis = _FakeSyncRedis()
+    monkeypatch.setattr("src.lib.redis_client.get_sync_redis", lambda: redis)
+
+    assert curation_lookup_cache.get_curation_lookup_cache().backend == "redis"
@@ -451,6 +451,94 @@ def test_search_genes_bulk_search_failure_is_transient_failure(monkeypatch):
     assert item["lookup_attempts"][0]["error"]["type"] == "TimeoutError"
 
 
+def test_search_genes_bulk_uses_set_based_lookup_with_per_pair_attempts(monkeypatch):
+    query_fn = _unwrap_query_function(agr_curation.agr_curation_query)
+    bulk_calls = []
+
+    class FakeDb:
+        @staticmethod
+        def search_entities(**_kwargs):
+            raise AssertionError("set-based lookup should replace per-pair searches")
+
+    def fake_search_entities_bulk(_db, *, entity_type, symbols, taxon_curies, include_synonyms, limit):
+        bulk_calls.append((entity_type, tuple(symbols), tuple(taxon_curies)))
+        return {
+            ("unc-54", "NCBITaxon:6239"): [
+                {"entity_curie": "WB:WBGene00006789", "entity": "unc-54", "match_type": "exact"}
+            ],
+            ("unc-54", "NCBITaxon:7227"): [],
+            ("dpp", "NCBITaxon:6239"): [],
+            ("dpp", "NCBITaxon:7227"): [],
+        }
+
+    def fake_fetch_gene_details_bulk(_db, curies):
+        return {
+            curie: {"curie": curie, "symbol": "unc-54", "name": "myosin", "taxon": "NCBITaxon:6239"}
+            for curie in curies
+        }, {}
+
+    class Resolver:
+        @staticmethod
+        def get_db_client():
+            return FakeDb()
+
+    monkeypatch.setattr(agr_curation, "get_curation_resolver", lambda: Resolver())
+    monkeypatch.setattr(
+        agr_curation, "PROVIDER_TO_TAXON", {"WB": "NCBITaxon:6239", "FB": "NCBITaxon:7227"}
+    )
+    monkeypatch.setattr(
+        agr_curation, "TAXON_TO_PROVIDER", {"NCBITaxon:6239": "WB", "NCBITaxon:7227": "FB"}
+    )
+    monkeypatch.setattr(agr_curation, "is_valid_curie", lambda _curie: True)
+    monkeypatch.setattr(agr_curation, "_search_entities_bulk", fake_search_entities_bulk)
+    monkeypatch.setattr(agr_curation, "_fetch_gene_details_bulk", fake_fetch_gene_details_bulk)
+
+    result = query_fn(method="search_genes_bulk", gene_symbols=["unc-54", "dpp"])
+
+    assert bulk_calls == [("gene", ("unc-54", "dpp"), ("NCBITaxon:6239", "NCBITaxon:7227"))]
+    resolved, missing = result.data["items"]
+    assert resolved["status"] == "resolved"
+    assert resolved["results"][0]["curie"] == "WB:WBGene00006789"
+    assert [
+        (attempt["attempted_query"]["taxon_id"], attempt["lookup_status"])
+        for attempt in resolved["lookup_attempts"]
+    ] == [("NCBITaxon:6239", "success"), ("NCBITaxon:7227", "not_found")]
+    assert missing["lookup_status"] == "not_found"
+    assert len(missing["lookup_attempts"]) == 2
+
+
+def test_search_alleles_bulk_falls_back_to_per_pair_search_when_set_lookup_fails(monkeypatch):
+    query_fn = _unwrap_query_function(agr_curation.agr_curation_query)
+    searched = []
+
+    class FakeDb:
+        @staticmethod
+        def search_entities(entity_type, search_pattern, taxon_curie, include_synonyms, limit):
+            _ = include_synonyms, limit
+            searched.append((entity_type, search_pattern, taxon_curie))
+            raise TimeoutError("search timeout")
+
+    def failing_search_entities_bulk(*_args, **_kwargs):
+        raise RuntimeError("array parameters unsupported")
+
+    class Resolver:
+        @staticmethod
+        def get_db_client():
+            return FakeDb()
+
+    monkeypatch.setattr(agr_curation, "get_curation_resolver", lambda: Resolver())
+    monkeypatch.setattr(agr_curation, "PROVIDER_TO_TAXON", {"WB": "NCBITaxon:6239"})
+    monkeypatch.setattr(agr_curation, "TAXON_TO_PROVIDER", {"NCBITaxon:6239": "WB"})
+    monkeypatch.setattr(agr_curation, "_search_entities_bulk", failing_search_entities_bulk)
+
+    result = query_fn(method="search_alleles_bulk", allele_symbols=["e1370"], data_provider="WB")
+
+    item = result.data["items"][0]
+    assert searched == [("allele", "e1370", "NCBITaxon:6239")]
+    assert item["status"] == "transient_failure"
+    assert item["lookup_attempts"][0]["error"]["type"] == "TimeoutError"
+
+
 def test_search_genes_queries_symbols_without_local_validation(monkeypatch):
     query_fn = _unwrap_query_function(agr_curation.agr_curation_query)
 
@@ -1160,3 +1248,75 @@ def test_search_alleles_bulk_caps_total_matches_and_reports_truncation(monkeypat
     assert returned_rows == 500
     assert sum(item["count"] for item in result.data["items"]) == 500
     assert result.data["total_matches"] == 500
+
+
+def test_lookup_cache_serves_repeats_and_skips_force_and_transient_results(monkeypatch):
+    from src.lib.database.curation_lookup_cache import CurationLookupCache
+
+    query_fn = _unwrap_query_function(agr_curation.agr_curation_query)
+    calls = {"map": 0, "detail": 0}
+    fail_details = {"value": False}
+
+    class _Display:
+        def __init__(self, text):
+            self.displayText = text
+
+    class FakeDb:
+        @staticmethod
+        def map_entity_names_to_curies(entity_type, entity_names, taxon_curie):
+            calls["map"] += 1
+            if entity_type == "gene" and taxon_curie == "NCBITaxon:6239":
+                return [{"entity_curie": "WB:WBGene00000001", "entity": entity_names[0]}]
+            return []
+
+        @staticmethod
+        def get_gene(curie):
+            calls["detail"] += 1
+            if fail_details["value"]:
+                raise TimeoutError("detail timeout")
+            return SimpleNamespace(
+                primaryExternalId=curie,
+                geneSymbol=_Display("unc-54"),
+                geneFullName=_Display("uncoordinated 54"),
+                geneType={"name": "protein_coding_gene"},
+            )
+
+    class Resolver:
+        @staticmethod
+        def get_db_client():
+            return FakeDb()
+
+    cache = CurationLookupCache(ttl_seconds=60, max_entries=16)
+    monkeypatch.setattr(agr_curation, "get_curation_lookup_cache", lambda: cache)
+    monkeypatch.setattr(agr_curation, "get_curation_resolver", lambda: Resolver())
+    monkeypatch.setattr(agr_curation, "PROVIDER_TO_TAXON", {"WB": "NCBITaxon:6239"})
+    monkeypatch.setattr(agr_curation, "TAXON_TO_PROVIDER", {"NCBITaxon:6239": "WB"})
+    monkeypatch.setattr(agr_curation, "is_valid_curie", lambda _curie: True)
+
+    first = query_fn(method="get_gene_by_exact_symbol", gene_symbol="unc-54", data_provider="WB")
+    repeat = query_fn(method="get_gene_by_exact_symbol", gene_symbol=" unc-54 ", data_provider="WB")
+
+    assert first.status == "ok"
+    assert repeat == first
+    assert calls == {"map": 1, "detail": 1}
+
+    forced = query_fn(
+        method="get_gene_by_exact_symbol",
+        gene_symbol="unc-54",
+        data_provider="WB",
+        force=True,
+    )
+    assert forced == first
+    assert calls == {"map": 2, "detail": 2}
+
+    fail_details["value"] = True
+    transient_first = query_fn(method="get_gene_by_exact_symbol", gene_symbol="daf-16", data_provider="WB")
+    transient_repeat = query_fn(method="get_gene_by_exact_symbol", gene_symbol="daf-16", data_provider="WB")
+
+    assert transient_first.lookup_status == "transient"
+    assert transient_repeat.lookup_status == "transient"
+    assert calls == {"map": 4, "detail": 4}
+    metrics = cache.metrics_snapshot()
+    assert metrics["hits"] == 1
+    assert metrics["bypasses"] == 1
+    assert metrics["stores"] == 2
@@ -9,6 +9,7 @@ from agr_ai_curation_alliance.tools.agr_lookup import (
     candidate_from_result,
     projection_from_entity_match,
     projection_from_result,
+    search_entities_bulk,
 )
 from agr_ai_curation_runtime.agr_lookup import LOOKUP_STATUS_TRANSIENT
 
@@ -171,3 +172,71 @@ def test_alliance_bulk_status_owns_detail_lookup_stages():
         )
         == "detail_failure"
     )
+
+
+class _TierSession:
+    def __init__(self, tier_rows):
+        self.tier_rows = list(tier_rows)
+        self.statements = []
+        self.closed = False
+
+    def execute(self, statement, params):
+        self.statements.append((str(statement), params))
+        rows = self.tier_rows.pop(0)
+        return type("_Result", (), {"fetchall": staticmethod(lambda: rows)})()
+
+    def close(self):
+        self.closed = True
+
+
+def test_search_entities_bulk_merges_tiers_per_symbol_and_taxon():
+    session = _TierSession(
+        [
+            [("UNC-54", "NCBITaxon:6239", "WB:G1", False, "unc-54")],
+            [
+                ("UNC-54", "NCBITaxon:6239", "WB:G2", False, "unc-54a"),
+                ("UNC-54", "NCBITaxon:6239", "WB:G3", False, "unc-54b"),
+            ],
+            [("DPP", "NCBITaxon:7227", "FB:G9", False, "Mad-dpp")],
+        ]
+    )
+    db = type("_Db", (), {"create_session": staticmethod(lambda: session)})()
+
+    results = search_entities_bulk(
+        db,
+        entity_type="gene",
+        symbols=["unc-54", "dpp", "Unc-54"],
+        taxon_curies=["NCBITaxon:6239", "NCBITaxon:7227"],
+        include_synonyms=True,
+        limit=2,
+    )
+
+    assert len(session.statements) == 3
+    assert session.closed
+    params = session.statements[0][1]
+    assert params["search_uppers"] == ["UNC-54", "DPP"]
+    assert "GeneSynonymSlotAnnotation" in params["annotation_types"]
+    assert [row["entity_curie"] for row in results[("unc-54", "NCBITaxon:6239")]] == [
+        "WB:G1",
+        "WB:G2",
+    ]
+    assert [row["match_type"] for row in results[("Unc-54", "NCBITaxon:6239")]] == [
+        "exact",
+        "starts_with",
+    ]
+    assert results[("dpp", "NCBITaxon:7227")][0]["match_type"] == "contains"
+    assert results[("dpp", "NCBITaxon:6239")] == []
+
+
+def test_search_entities_bulk_requires_sql_session_support():
+    assert (
+        search_entities_bulk(
+            object(),
+            entity_type="allele",
+            symbols=["e1370"],
+            taxon_curies=["NCBITaxon:6239"],
+            include_synonyms=False,
+            limit=10,
+        )
+        is None
+    )
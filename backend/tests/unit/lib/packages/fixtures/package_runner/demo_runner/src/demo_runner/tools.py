@@ -56,6 +56,27 @@ def explode_value(value: str) -> dict[str, str]:
     raise RuntimeError(f"boom: {value}")
 
 
+def report_worker_pid() -> dict[str, int]:
+    import os
+
+    return {"pid": os.getpid()}
+
+
+def sleep_value(seconds: float, value: str = "done") -> dict[str, str]:
+    import time
+
+    time.sleep(seconds)
+    return {"value": value}
+
+
+def noisy_value(value: str) -> dict[str, str]:
+    import sys
+
+    print(f"tool stdout: {value}")
+    print(f"tool stderr: {value}", file=sys.stderr)
+    return {"value": value}
+
+
 sdk_static_tool = FakeSdkTool(prefix="static:")
 sdk_static_context_probe = ContextProbeSdkTool()
 
@@ -0,0 +1,217 @@
+"""Unit tests for warm package tool worker pooling."""
+
+from __future__ import annotations
+
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.lib.packages import package_runner
+from src.lib.packages.package_runner import (
+    PackageToolRunner,
+    get_package_worker_pool_metrics,
+    get_shared_package_worker_pool,
+    shutdown_shared_package_worker_pool,
+)
+from src.lib.packages.runner_protocol import (
+    RunnerWorkerFrame,
+    RunnerProtocolError,
+    decode_worker_frame,
+    encode_worker_frame,
+)
+from src.lib.packages.tool_registry import load_tool_registry
+from src.lib.packages.worker_pool import PackageWorkerPool
+
+FIXTURE_PACKAGE_DIR = (
+    Path(__file__).resolve().parent / "fixtures" / "package_runner" / "demo_runner"
+)
+ENTRYPOINT_PATH = (
+    Path(package_runner.__file__).resolve().with_name("package_runner_entrypoint.py")
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_runtime_path_env(monkeypatch):
+    for variable in (
+        "AGR_RUNTIME_ROOT",
+        "AGR_RUNTIME_PACKAGES_DIR",
+        "AGR_RUNTIME_STATE_DIR",
+        "PACKAGE_RUNNER_WORKER_POOL_ENABLED",
+        "PYTHONPATH",
+    ):
+        monkeypatch.delenv(variable, raising=False)
+    yield
+    shutdown_shared_package_worker_pool()
+
+
+@pytest.fixture
+def pooled_runner(monkeypatch, tmp_path):
+    pools: list[PackageWorkerPool] = []
+
+    def _build(*, pool_size: int = 2, max_requests: int = 200, timeout_seconds: float = 60.0):
+        packages_dir = tmp_path / "runtime" / "packages"
+        if not packages_dir.exists():
+            shutil.copytree(FIXTURE_PACKAGE_DIR, packages_dir / FIXTURE_PACKAGE_DIR.name)
+        monkeypatch.setenv("AGR_RUNTIME_ROOT", str(tmp_path / "runtime"))
+        registry = load_tool_registry(
+            packages_dir,
+            runtime_version="1.5.0",
+            supported_package_api_version="1.0.0",
+        )
+        pool = PackageWorkerPool(
+            entrypoint_path=ENTRYPOINT_PATH,
+            pool_size=pool_size,
+            max_requests_per_worker=max_requests,
+        )
+        pools.append(pool)
+        runner = PackageToolRunner(
+            tool_registry=registry,
+            timeout_seconds=timeout_seconds,
+            worker_pool=pool,
+        )
+        return runner, pool
+
+    yield _build
+    for pool in pools:
+        pool.close()
+
+
+def test_worker_frame_round_trip_and_validation():
+    frame = RunnerWorkerFrame(response='{"status": "ok", "result": 1}', stdout="hi\n")
+
+    encoded = encode_worker_frame(frame)
+
+    assert "\n" not in encoded
+    assert decode_worker_frame(encoded) == frame
+    with pytest.raises(RunnerProtocolError):
+        decode_worker_frame('{"response": ""}')
+
+
+def test_pooled_runner_reuses_one_warm_worker(pooled_runner):
+    runner, pool = pooled_runner(pool_size=1)
+
+    first = runner.execute_tool("report_worker_pid")
+    second = runner.execute_tool("report_worker_pid")
+    echoed = runner.execute_tool("echo_value", kwargs={"value": "hello", "prefix": "pre-"})
+
+    assert first.ok and second.ok
+    assert first.result["pid"] == second.result["pid"]
+    assert echoed.result == {"value": "pre-hello"}
+    assert second.queue_wait_seconds is not None
+    assert second.execution_seconds is not None
+    metrics = pool.metrics_snapshot()
+    assert metrics["calls"] == 3
+    assert metrics["spawns"] == 1
+
+
+def test_pooled_runner_matches_one_shot_results(pooled_runner):
+    runner, _pool = pooled_runner()
+
+    context_result = runner.execute_tool(
+        "build_message",
+        kwargs={"subject": "Curation", "punctuation": "?"},
+        context={"document_id": "DOC-1", "user_id": "user-7"},
+    )
+    sdk_result = runner.execute_tool("sdk_static_tool", kwargs={"message": "hello"})
+    failure = runner.execute_tool("explode_value", kwargs={"value": "kaboom"})
+    probe = runner.execute_tool("sdk_static_context_probe", context={"trace_id": "trace-1"})
+    probe_after = runner.execute_tool("sdk_static_context_probe")
+
+    assert context_result.result == {"message": "Curation for DOC-1 by user-7?"}
+    assert sdk_result.result == {"message": "static:hello!"}
+    assert failure.ok is False
+    assert failure.error.code == "execution_failure"
+    assert "boom: kaboom" in failure.error.message
+    assert probe.result["trace_id"] == "trace-1"
+    # Request context does not leak into the next call served by the same worker.
+    assert probe_after.result["trace_id"] is None
+
+
+def test_pooled_runner_captures_tool_output_outside_protocol_channel(pooled_runner):
+    runner, _pool = pooled_runner(pool_size=1)
+
+    result = runner.execute_tool("noisy_value", kwargs={"value": "loud"})
+    follow_up = runner.execute_tool("echo_value", kwargs={"value": "quiet"})
+
+    assert result.ok is True
+    assert result.result == {"value": "loud"}
+    assert result.stdout == "tool stdout: loud\n"
+    assert result.stderr == "tool stderr: loud\n"
+    assert follow_up.result == {"value": "quiet"}
+
+
+def test_pooled_runner_recycles_workers_after_max_requests(pooled_runner):
+    runner, pool = pooled_runner(pool_size=1, max_requests=2)
+
+    pids = [runner.execute_tool("report_worker_pid").result["pid"] for _ in range(4)]
+
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[1] != pids[2]
+    metrics = pool.metrics_snapshot()
+    assert metrics["recycles"] == 2
+    assert metrics["spawns"] == 2
+
+
+def test_pooled_runner_timeout_replaces_only_the_stuck_worker(pooled_runner):
+    runner, pool = pooled_runner(pool_size=2, timeout_seconds=2.0)
+    warmups = [
+        threading.Thread(
+            target=runner.execute_tool,
+            args=("sleep_value",),
+            kwargs={"kwargs": {"seconds": 0.5}},
+        )
+        for _ in range(2)
+    ]
+    for thread in warmups:
+        thread.start()
+    for thread in warmups:
+        thread.join(timeout=30)
+    assert pool.metrics_snapshot()["spawns"] == 2
+
+    slow = runner.execute_tool("sleep_value", kwargs={"seconds": 30})
+
+    assert slow.ok is False
+    assert slow.error.code == "execution_failure"
+    assert slow.error.details["timeout_seconds"] == 2.0
+
+    # The sibling worker stays warm and serves the next call without a spawn.
+    follow_up = runner.execute_tool("echo_value", kwargs={"value": "still-warm"})
+    metrics = pool.metrics_snapshot()
+    assert follow_up.result == {"value": "still-warm"}
+    assert metrics["timeouts"] == 1
+    assert metrics["spawns"] == 2
+
+
+def test_pooled_runner_bounds_concurrency_to_pool_size(pooled_runner):
+    runner, pool = pooled_runner(pool_size=1)
+    results = []
+
+    def _call(index: int):
+        results.append(runner.execute_tool("sleep_value", kwargs={"seconds": 0.2, "value": str(index)}))
+
+    threads = [threading.Thread(target=_call, args=(index,)) for index in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert sorted(result.result["value"] for result in results) == ["0", "1", "2"]
+    metrics = pool.metrics_snapshot()
+    assert metrics["spawns"] == 1
+    assert metrics["queue_wait_ms_max"] >= 100
+
+
+def test_shared_worker_pool_follows_configuration(monkeypatch):
+    assert get_shared_package_worker_pool() is None
+    assert get_package_worker_pool_metrics() is None
+
+    monkeypatch.setenv("PACKAGE_RUNNER_WORKER_POOL_ENABLED", "true")
+    monkeypatch.setenv("PACKAGE_RUNNER_WORKER_POOL_SIZE", "3")
+    pool = get_shared_package_worker_pool()
+
+    assert pool is not None
+    assert get_shared_package_worker_pool() is pool
+    assert get_package_worker_pool_metrics()["pool_size"] == 3
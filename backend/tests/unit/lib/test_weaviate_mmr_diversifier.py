@@ -0,0 +1,147 @@
+"""Parity and behavior tests for the vectorized MMR diversifier."""
+
+import numpy as np
+import pytest
+
+from src.lib.weaviate_client.mmr_diversifier import (
+    mmr_diversify,
+    mmr_diversify_batch,
+    select_mmr_indices,
+)
+
+
+def _legacy_mmr_order(chunks, lambda_param, top_k, vector_field="_vector"):
+    """Pairwise reference implementation the vectorized engine replaced."""
+    chunks_with_vectors = [c for c in chunks if vector_field in c]
+    scores = np.array([c.get("score", 0) for c in chunks_with_vectors])
+    if scores.max() > 0:
+        scores = scores / scores.max()
+
+    selected = []
+    remaining = list(range(len(chunks_with_vectors)))
+    while remaining and len(selected) < top_k:
+        if not selected:
+            best_idx = remaining[int(np.argmax(scores[remaining]))]
+        else:
+            best_mmr = -float("inf")
+            best_idx = None
+            for idx in remaining:
+                max_sim = 0.0
+                for sel_idx in selected:
+                    vec1 = chunks_with_vectors[idx][vector_field]
+                    vec2 = chunks_with_vectors[sel_idx][vector_field]
+                    if isinstance(vec1, dict):
+                        vec1 = vec1.get("default") or list(vec1.values())[0]
+                    if isinstance(vec2, dict):
+                        vec2 = vec2.get("default") or list(vec2.values())[0]
+                    vec1 = np.array(vec1)
+                    vec2 = np.array(vec2)
+                    sim = np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2) + 1e-10)
+                    max_sim = max(max_sim, sim)
+                mmr = lambda_param * scores[idx] - (1 - lambda_param) * max_sim
+                if mmr > best_mmr:
+                    best_mmr = mmr
+                    best_idx = idx
+        selected.append(best_idx)
+        remaining.remove(best_idx)
+    return [chunks_with_vectors[idx]["id"] for idx in selected]
+
+
+def _candidate_pool(seed, size, dim=32, *, dict_vectors=False):
+    rng = np.random.default_rng(seed)
+    # Clustered vectors make diversity actually change the ordering.
+    centers = rng.normal(size=(4, dim))
+    chunks = []
+    for index in range(size):
+        vector = centers[index % 4] + 0.3 * rng.normal(size=dim)
+        chunks.append(
+            {
+                "id": f"chunk-{index}",
+                "score": float(rng.uniform(0.1, 1.0)),
+                "_vector": {"default": vector.tolist()} if dict_vectors else vector.tolist(),
+            }
+        )
+    return chunks
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("size", [25, 100])
+@pytest.mark.parametrize("lambda_param", [0.0, 0.3, 0.5, 0.9])
+def test_mmr_diversify_matches_legacy_selection_order(seed, size, lambda_param):
+    chunks = _candidate_pool(seed, size, dict_vectors=seed % 2 == 0)
+
+    result = mmr_diversify(chunks, lambda_param=lambda_param, top_k=10)
+
+    assert [chunk["id"] for chunk in result] == _legacy_mmr_order(chunks, lambda_param, 10)
+    assert all("_vector" not in chunk for chunk in result)
+
+
+def test_mmr_diversify_returns_every_candidate_when_top_k_exceeds_pool():
+    chunks = _candidate_pool(7, 6)
+
+    result = mmr_diversify(chunks, lambda_param=0.5, top_k=20)
+
+    assert [chunk["id"] for chunk in result] == _legacy_mmr_order(chunks, 0.5, 20)
+    assert len(result) == 6
+
+
+def test_mmr_diversify_skips_chunks_without_vectors_and_keeps_input_intact():
+    chunks = _candidate_pool(3, 8)
+    chunks[2].pop("_vector")
+
+    result = mmr_diversify(chunks, lambda_param=0.5, top_k=10)
+
+    assert "chunk-2" not in [chunk["id"] for chunk in result]
+    assert all("_vector" in chunk for index, chunk in enumerate(chunks) if index != 2)
+
+
+def test_mmr_diversify_falls_back_to_score_order_without_vectors():
+    chunks = [{"id": "a", "score": 0.2}, {"id": "b", "score": 0.9}, {"id": "c", "score": 0.5}]
+
+    result = mmr_diversify(chunks, top_k=2)
+
+    assert [chunk["id"] for chunk in result] == ["b", "c"]
+
+
+def test_mmr_diversify_handles_zero_vectors_and_empty_input():
+    chunks = [
+        {"id": "a", "score": 1.0, "_vector": [0.0, 0.0]},
+        {"id": "b", "score": 0.5, "_vector": [1.0, 0.0]},
+    ]
+
+    assert [chunk["id"] for chunk in mmr_diversify(chunks, top_k=2)] == ["a", "b"]
+    assert mmr_diversify([], top_k=3) == []
+    assert mmr_diversify(chunks, top_k=0) == []
+
+
+def test_select_mmr_indices_penalizes_near_duplicates():
+    relevance = np.array([1.0, 0.99, 0.5])
+    unit_vectors = np.array([[1.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+
+    assert select_mmr_indices(relevance, unit_vectors, lambda_param=0.5, top_k=2) == [0, 2]
+
+
+def test_mmr_diversify_batch_matches_per_pool_results():
+    groups = [
+        _candidate_pool(11, 25),
+        _candidate_pool(12, 100, dict_vectors=True),
+        [],
+        [{"id": "no-vector", "score": 0.4}],
+        _candidate_pool(13, 4),
+    ]
+
+    batched = mmr_diversify_batch(groups, lambda_param=0.4, top_k=10)
+
+    assert len(batched) == len(groups)
+    for group, result in zip(groups, batched):
+        expected = mmr_diversify(group, lambda_param=0.4, top_k=10)
+        assert [chunk["id"] for chunk in result] == [chunk["id"] for chunk in expected]
+
+
+def test_mmr_diversify_batch_handles_mixed_vector_dimensions():
+    groups = [_candidate_pool(21, 12, dim=8), _candidate_pool(22, 12, dim=16)]
+
+    batched = mmr_diversify_batch(groups, lambda_param=0.5, top_k=5)
+
+    for group, result in zip(groups, batched):
+        assert [chunk["id"] for chunk in result] == _legacy_mmr_order(group, 0.5, 5)
@@ -5,6 +5,7 @@ Provides structured access to the Alliance Genome Resources Curation Database
 using the official agr-curation-api-client package.
 """
 
+import functools
 import logging
 import os
 import re
@@ -44,8 +45,15 @@ from .agr_lookup import (
     lookup_response_payload as _lookup_response_payload,
     projection_from_entity_match as _projection_from_entity_match,
     projection_from_result as _projection_from_result,
+    search_entities_bulk as _search_entities_bulk,
+)
+from agr_ai_curation_runtime import (
+    build_lookup_cache_key,
+    get_curation_lookup_cache,
+    get_curation_resolver,
+    is_valid_curie,
+    list_groups,
 )
-from agr_ai_curation_runtime import get_curation_resolver, is_valid_curie, list_groups
 from agr_ai_curation_runtime.extraction_builder import (
     CANDIDATE_STATUS_VALID,
     ExtractionBuilderError,
@@ -1105,6 +1113,39 @@ def _search_alleles_fuzzy_via_db(
             session.close()
 
 
+def _prefetch_bulk_symbol_matches(
+    db: Any,
+    *,
+    entity_type: str,
+    symbols: List[str],
+    taxon_ids: List[str],
+    include_synonyms: bool,
+    limit: int,
+) -> Optional[Dict[Tuple[str, str], List[Dict[str, Any]]]]:
+    """Resolve all bulk symbols across taxa with set-based SQL.
+
+    Returns None when the DB client has no SQL session or the set-based query
+    fails; bulk methods then search each (symbol, taxon) pair individually so
+    per-pair transient failures are still recorded in lookup_attempts.
+    """
+    try:
+        return _search_entities_bulk(
+            db,
+            entity_type=entity_type,
+            symbols=symbols,
+            taxon_curies=taxon_ids,
+            include_synonyms=include_synonyms,
+            limit=limit,
+        )
+    except Exception as exc:
+        logger.warning(
+            "Set-based %s bulk search failed; searching per taxon instead: %s",
+            entity_type,
+            exc,
+        )
+        return None
+
+
 def _ok(
     data: Any = None,
     count: Optional[int] = None,
@@ -1193,7 +1234,68 @@ def _ensure_provider_mappings(method: str) -> Optional[AgrQueryResult]:
 
 
 
+# Arguments that steer the call but not the lookup result; excluded from cache keys.
+_LOOKUP_CACHE_IGNORED_ARGS = frozenset({"force", "force_reason", "validation_retry_context"})
+
+
+def _is_cacheable_query_result(result: Any) -> bool:
+    """Only settled successful lookups are shared; errors and transient failures retry."""
+    if not isinstance(result, AgrQueryResult) or result.status != "ok":
+        return False
+    if result.lookup_status == LOOKUP_STATUS_TRANSIENT:
+        return False
+    return not any(
+        isinstance(attempt, Mapping) and attempt.get("lookup_status") == LOOKUP_STATUS_TRANSIENT
+        for attempt in result.lookup_attempts or ()
+    )
+
+
+def _with_lookup_cache(func):
+    """Serve repeated agr_curation_query calls from the shared lookup cache.
+
+    Keys cover the method, its normalized arguments and the loaded provider to
+    taxon mapping. ``force=True`` skips the cached read but refreshes the entry.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> AgrQueryResult:
+        cache = get_curation_lookup_cache()
+        if cache is None:
+            return func(*args, **kwargs)
+        try:
+            bound = signature.bind(*args, **kwargs)
+        except TypeError:
+            return func(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = {
+            name: value
+            for name, value in bound.arguments.items()
+            if name not in _LOOKUP_CACHE_IGNORED_ARGS
+        }
+        arguments["_provider_to_taxon"] = sorted(PROVIDER_TO_TAXON.items())
+        key = build_lookup_cache_key(f"agr_curation_query.{arguments.get('method')}", arguments)
+
+        if bound.arguments.get("force"):
+            cache.record_bypass()
+        else:
+            cached = cache.get(key)
+            if cached is not None:
+                try:
+                    return AgrQueryResult.model_validate_json(cached)
+                except ValidationError:
+                    logger.warning("Discarding unreadable cached lookup result for %s", key)
+
+        result = func(*args, **kwargs)
+        if _is_cacheable_query_result(result):
+            cache.set(key, result.model_dump_json())
+        return result
+
+    return wrapper
+
+
 @function_tool(strict_mode=False)
+@_with_lookup_cache
 def agr_curation_query(
     method: str,
     gene_symbol: Optional[str] = None,
@@ -1825,17 +1927,29 @@ def agr_curation_query(
             gene_curies_by_taxon: Dict[str, List[str]] = defaultdict(list)
             lookup_attempts_by_symbol: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
+            prefetched_matches = _prefetch_bulk_symbol_matches(
+                db,
+                entity_type='gene',
+                symbols=normalized_symbols,
+                taxon_ids=taxon_ids,
+                include_synonyms=include_synonyms,
+                limit=limit_value,
+            )
+
             for symbol in normalized_symbols:
                 symbol_matches: List[Dict[str, Any]] = []
                 for tid in taxon_ids:
                     try:
-                        results = db.search_entities(
-                            entity_type='gene',
-                            search_pattern=symbol,
-                            taxon_curie=tid,
-                            include_synonyms=include_synonyms,
-                            limit=limit_value
-                        )
+                        if prefetched_matches is not None:
+                            results = prefetched_matches.get((symbol, tid), [])
+                        else:
+                            results = db.search_entities(
+                                entity_type='gene',
+                                search_pattern=symbol,
+                                taxon_curie=tid,
+                                include_synonyms=include_synonyms,
+                                limit=limit_value
+                            )
                         lookup_attempts_by_symbol[symbol].append(
                             _lookup_attempt(
                                 method=method,
@@ -2558,17 +2672,29 @@ def agr_curation_query(
             allele_curies_by_taxon: Dict[str, List[str]] = defaultdict(list)
             lookup_attempts_by_symbol: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
+            prefetched_matches = _prefetch_bulk_symbol_matches(
+                db,
+                entity_type='allele',
+                symbols=normalized_symbols,
+                taxon_ids=taxon_ids,
+                include_synonyms=include_synonyms,
+                limit=limit_value,
+            )
+
             for symbol in normalized_symbols:
                 symbol_matches: List[Dict[str, Any]] = []
                 for tid in taxon_ids:
                     try:
-                        results = db.search_entities(
-                            entity_type='allele',
-                            search_pattern=symbol,
-                            taxon_curie=tid,
-                            include_synonyms=include_synonyms,
-                            limit=limit_value
-                        )
+                        if prefetched_matches is not None:
+                            results = prefetched_matches.get((symbol, tid), [])
+                        else:
+                            results = db.search_entities(
+                                entity_type='allele',
+                                search_pattern=symbol,
+                                taxon_curie=tid,
+                                include_synonyms=include_synonyms,
+                                limit=limit_value
+                            )
                         if data_provider and not results:
                             results = _search_alleles_fuzzy_via_db(
                                 db,
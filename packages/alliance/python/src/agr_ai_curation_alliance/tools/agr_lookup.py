@@ -548,6 +548,194 @@ def fetch_allele_details_bulk(
         }
     return details, detail_failures
 
+_BULK_SEARCH_ENTITY_TABLES = {
+    "gene": ("gene", "singlegene_id"),
+    "allele": ("allele", "singleallele_id"),
+}
+
+# Tier predicates mirror the curation client's search_entities tiers. Each
+# tier excludes entities already matched by an earlier tier for the same input.
+_BULK_SEARCH_TIERS = (
+    (
+        "exact",
+        1,
+        "UPPER(sa.displaytext) = ANY(CAST(:search_uppers AS text[]))",
+        "UPPER(ms.displaytext) = i.search_upper",
+        None,
+    ),
+    (
+        "starts_with",
+        2,
+        "UPPER(sa.displaytext) LIKE ANY(CAST(:starts_patterns AS text[]))",
+        "UPPER(ms.displaytext) LIKE i.search_upper || '%' "
+        "AND UPPER(ms.displaytext) <> i.search_upper",
+        "UPPER(prior.displaytext) = i.search_upper",
+    ),
+    (
+        "contains",
+        3,
+        "UPPER(sa.displaytext) LIKE ANY(CAST(:contains_patterns AS text[]))",
+        "UPPER(ms.displaytext) LIKE '%' || i.search_upper || '%' "
+        "AND UPPER(ms.displaytext) NOT LIKE i.search_upper || '%'",
+        "UPPER(prior.displaytext) LIKE i.search_upper || '%'",
+    ),
+)
+
+
+def _bulk_search_annotation_types(entity_type: str, include_synonyms: bool) -> list[str]:
+    if entity_type == "gene":
+        types = [
+            "GeneSymbolSlotAnnotation",
+            "GeneSystematicNameSlotAnnotation",
+            "GeneFullNameSlotAnnotation",
+        ]
+        if include_synonyms:
+            types.append("GeneSynonymSlotAnnotation")
+        return types
+    types = ["AlleleSymbolSlotAnnotation"]
+    if include_synonyms:
+        types.extend(["AlleleFullNameSlotAnnotation", "AlleleSynonymSlotAnnotation"])
+    return types
+
+
+def _bulk_search_tier_sql(
+    *,
+    entity_table: str,
+    entity_id_field: str,
+    slot_filter: str,
+    input_match: str,
+    prior_match: str | None,
+) -> str:
+    prior_exclusion = ""
+    if prior_match:
+        prior_exclusion = f"""
+                AND NOT EXISTS (
+                    SELECT 1 FROM slotannotation prior
+                    WHERE prior.{entity_id_field} = ms.{entity_id_field}
+                    AND prior.slotannotationtype = ANY(CAST(:annotation_types AS text[]))
+                    AND prior.obsolete = false
+                    AND {prior_match}
+                )"""
+    return f"""
+            WITH inputs AS (
+                SELECT DISTINCT search_upper
+                FROM unnest(CAST(:search_uppers AS text[])) AS input(search_upper)
+            ),
+            matching_slots AS MATERIALIZED (
+                SELECT sa.{entity_id_field}, sa.displaytext, sa.obsolete
+                FROM slotannotation sa
+                WHERE sa.slotannotationtype = ANY(CAST(:annotation_types AS text[]))
+                AND sa.obsolete = false
+                AND sa.{entity_id_field} IS NOT NULL
+                AND {slot_filter}
+            ),
+            matched AS (
+                SELECT DISTINCT ON (i.search_upper, be.primaryexternalid)
+                    i.search_upper,
+                    ot.curie AS taxon_curie,
+                    be.primaryexternalid AS entity_curie,
+                    ms.obsolete,
+                    ms.displaytext
+                FROM inputs i
+                JOIN matching_slots ms ON {input_match}
+                JOIN {entity_table} e ON e.id = ms.{entity_id_field}
+                JOIN biologicalentity be ON be.id = e.id
+                JOIN ontologyterm ot ON be.taxon_id = ot.id
+                WHERE ot.curie = ANY(CAST(:taxon_curies AS text[])){prior_exclusion}
+                ORDER BY i.search_upper, be.primaryexternalid, ms.displaytext
+            )
+            SELECT search_upper, taxon_curie, entity_curie, obsolete, displaytext
+            FROM (
+                SELECT
+                    matched.*,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY search_upper, taxon_curie
+                        ORDER BY entity_curie
+                    ) AS pair_rank
+                FROM matched
+            ) ranked
+            WHERE pair_rank <= :limit
+            ORDER BY search_upper, taxon_curie, entity_curie
+        """
+
+
+def search_entities_bulk(
+    db: Any,
+    *,
+    entity_type: str,
+    symbols: list[str],
+    taxon_curies: list[str],
+    include_synonyms: bool,
+    limit: int,
+) -> dict[tuple[str, str], list[dict[str, Any]]] | None:
+    """Resolve every (symbol, taxon) pair with one SQL statement per match tier.
+
+    Results per pair match ``db.search_entities(entity_type, symbol, taxon)``:
+    exact, then starts-with, then contains candidates, each tier ordered by
+    CURIE and the whole list capped at ``limit``. Returns ``None`` when the DB
+    client cannot open a SQLAlchemy session so callers can fall back to the
+    per-pair client method; SQL errors propagate to the caller.
+    """
+    tables = _BULK_SEARCH_ENTITY_TABLES.get(entity_type)
+    if tables is None:
+        raise ValueError(f"Unsupported entity_type for bulk search: {entity_type!r}")
+    entity_table, entity_id_field = tables
+
+    symbols_by_upper: dict[str, list[str]] = {}
+    for symbol in symbols:
+        if symbol:
+            symbols_by_upper.setdefault(symbol.upper(), []).append(symbol)
+    if not symbols_by_upper or not taxon_curies or limit <= 0:
+        return {(symbol, taxon): [] for symbol in symbols for taxon in taxon_curies}
+
+    from sqlalchemy import text
+
+    session = create_db_session(db)
+    if session is None:
+        return None
+
+    search_uppers = list(symbols_by_upper)
+    params: dict[str, Any] = {
+        "search_uppers": search_uppers,
+        "starts_patterns": [f"{value}%" for value in search_uppers],
+        "contains_patterns": [f"%{value}%" for value in search_uppers],
+        "annotation_types": _bulk_search_annotation_types(entity_type, include_synonyms),
+        "taxon_curies": list(dict.fromkeys(taxon_curies)),
+        "limit": limit,
+    }
+    tier_rows: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    try:
+        for match_type, relevance, slot_filter, input_match, prior_match in _BULK_SEARCH_TIERS:
+            sql_query = text(
+                _bulk_search_tier_sql(
+                    entity_table=entity_table,
+                    entity_id_field=entity_id_field,
+                    slot_filter=slot_filter,
+                    input_match=input_match,
+                    prior_match=prior_match,
+                )
+            )
+            for row in session.execute(sql_query, params).fetchall():
+                tier_rows.setdefault((row[0], row[1]), []).append(
+                    {
+                        "entity_curie": row[2],
+                        "is_obsolete": row[3],
+                        "entity": row[4],
+                        "match_type": match_type,
+                        "relevance": relevance,
+                    }
+                )
+    finally:
+        session.close()
+
+    results: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    for search_upper, input_symbols in symbols_by_upper.items():
+        for taxon in taxon_curies:
+            matches = tier_rows.get((search_upper, taxon), [])[:limit]
+            for symbol in input_symbols:
+                results[(symbol, taxon)] = [dict(match) for match in matches]
+    return results
+
 
 __all__ = [
     "ALLIANCE_CURATION_DB_PROVIDER",
@@ -567,4 +755,5 @@ __all__ = [
     "lookup_response_payload",
     "projection_from_entity_match",
     "projection_from_result",
+    "search_entities_bulk",
 ]
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Benchmark set-based bulk gene/allele symbol lookup against per-pair search.
+
+Seeds a throwaway schema in a local PostgreSQL database with the slice of the
+curation DB schema that symbol search touches (slotannotation, gene, allele,
+biologicalentity, ontologyterm), then resolves 10/50/200 symbols across every
+taxon two ways:
+
+* legacy: one ``DatabaseMethods.search_entities`` call per (symbol, taxon)
+  pair, which is what ``search_genes_bulk``/``search_alleles_bulk`` issued
+  before the set-based path;
+* bulk: ``search_entities_bulk``, one SQL statement per match tier.
+
+Both must return identical per-pair candidates. The schema is dropped on exit.
+
+Example:
+    python scripts/utilities/agr_bulk_symbol_lookup_benchmark.py \\
+        --database-url postgresql://postgres@127.0.0.1:5432/postgres
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path[:0] = [
+    str(REPO_ROOT / "backend"),
+    str(REPO_ROOT / "backend" / "src"),
+    str(REPO_ROOT / "packages" / "alliance" / "python" / "src"),
+]
+
+from agr_curation_api.db_methods import DatabaseMethods  # noqa: E402
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from agr_ai_curation_alliance.tools.agr_lookup import search_entities_bulk  # noqa: E402
+
+TAXA = [
+    "NCBITaxon:10090",
+    "NCBITaxon:10116",
+    "NCBITaxon:559292",
+    "NCBITaxon:6239",
+    "NCBITaxon:7227",
+    "NCBITaxon:7955",
+    "NCBITaxon:9606",
+]
+GENE_FAMILIES = ["pax", "sox", "hox", "wnt", "notch", "fgf", "bmp", "shh", "rut", "dpp"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare set-based bulk symbol lookup with per-(symbol, taxon) search.",
+    )
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCHMARK_DATABASE_URL", "postgresql://postgres@127.0.0.1:5432/postgres"),
+        help="PostgreSQL URL; a temporary schema is created and dropped there",
+    )
+    parser.add_argument("--symbol-counts", default="10,50,200", help="Comma-separated bulk sizes")
+    parser.add_argument("--genes-per-taxon", type=int, default=3000)
+    parser.add_argument("--alleles-per-gene", type=int, default=2)
+    parser.add_argument("--limit", type=int, default=100, help="Per-symbol candidate limit")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    return parser.parse_args()
+
+
+class _BenchmarkDb:
+    """Expose the client surface the bulk helpers use, bound to one engine."""
+
+    def __init__(self, engine: Any) -> None:
+        self._methods = DatabaseMethods()
+        self._methods._engine = engine
+
+    def search_entities(self, **kwargs: Any) -> list[dict[str, Any]]:
+        return self._methods.search_entities(**kwargs)
+
+    def create_session(self) -> Any:
+        return self._methods._create_session()
+
+
+def create_fixture(engine: Any, schema: str, args: argparse.Namespace) -> list[str]:
+    rng = random.Random(args.seed)
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+        conn.execute(text(f"SET search_path TO {schema}"))
+        conn.execute(text("CREATE TABLE ontologyterm (id bigint PRIMARY KEY, curie text)"))
+        conn.execute(
+            text(
+                "CREATE TABLE biologicalentity (id bigint PRIMARY KEY, primaryexternalid text, "
+                "taxon_id bigint, obsolete boolean DEFAULT false, internal boolean DEFAULT false)"
+            )
+        )
+        conn.execute(text("CREATE TABLE gene (id bigint PRIMARY KEY, genetype_id bigint)"))
+        conn.execute(text("CREATE TABLE allele (id bigint PRIMARY KEY)"))
+        conn.execute(
+            text(
+                "CREATE TABLE slotannotation (id bigserial PRIMARY KEY, slotannotationtype text, "
+                "displaytext text, obsolete boolean DEFAULT false, singlegene_id bigint, "
+                "singleallele_id bigint)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO ontologyterm (id, curie) VALUES "
+                + ", ".join(f"({index + 1}, '{taxon}')" for index, taxon in enumerate(TAXA))
+            )
+        )
+
+        entities: list[dict[str, Any]] = []
+        slots: list[dict[str, Any]] = []
+        gene_symbols: list[str] = []
+        next_id = 1000
+        for taxon_index, _taxon in enumerate(TAXA):
+            for gene_index in range(args.genes_per_taxon):
+                family = GENE_FAMILIES[gene_index % len(GENE_FAMILIES)]
+                symbol = f"{family}{gene_index // len(GENE_FAMILIES)}"
+                gene_id = next_id
+                next_id += 1
+                entities.append(
+                    {"id": gene_id, "curie": f"T{taxon_index}:G{gene_index:06d}", "taxon": taxon_index + 1}
+                )
+                gene_symbols.append(symbol)
+                slots.append({"type": "GeneSymbolSlotAnnotation", "text": symbol, "gene": gene_id, "allele": None})
+                slots.append(
+                    {"type": "GeneFullNameSlotAnnotation", "text": f"{family} family member {symbol}", "gene": gene_id, "allele": None}
+                )
+                if rng.random() < 0.5:
+                    slots.append(
+                        {"type": "GeneSynonymSlotAnnotation", "text": f"{symbol}-like", "gene": gene_id, "allele": None}
+                    )
+                for allele_index in range(args.alleles_per_gene):
+                    allele_id = next_id
+                    next_id += 1
+                    entities.append(
+                        {
+                            "id": allele_id,
+                            "curie": f"T{taxon_index}:A{gene_index:06d}{allele_index}",
+                            "taxon": taxon_index + 1,
+                        }
+                    )
+                    slots.append(
+                        {"type": "AlleleSymbolSlotAnnotation", "text": f"{symbol}<{allele_index + 1}>", "gene": None, "allele": allele_id}
+                    )
+
+        conn.execute(
+            text("INSERT INTO biologicalentity (id, primaryexternalid, taxon_id) VALUES (:id, :curie, :taxon)"),
+            entities,
+        )
+        conn.execute(
+            text("INSERT INTO gene (id) VALUES (:id)"),
+            [{"id": entity["id"]} for entity in entities if ":G" in entity["curie"]],
+        )
+        conn.execute(
+            text("INSERT INTO allele (id) VALUES (:id)"),
+            [{"id": entity["id"]} for entity in entities if ":A" in entity["curie"]],
+        )
+        conn.execute(
+            text(
+                "INSERT INTO slotannotation (slotannotationtype, displaytext, singlegene_id, singleallele_id) "
+                "VALUES (:type, :text, :gene, :allele)"
+            ),
+            slots,
+        )
+        conn.execute(text("CREATE INDEX ON slotannotation (UPPER(displaytext))"))
+        conn.execute(text("CREATE INDEX ON slotannotation (singlegene_id)"))
+        conn.execute(text("CREATE INDEX ON slotannotation (singleallele_id)"))
+        conn.execute(text("ANALYZE"))
+    return sorted(set(gene_symbols))
+
+
+def pick_symbols(rng: random.Random, known_symbols: list[str], count: int) -> list[str]:
+    symbols = rng.sample(known_symbols, k=max(1, count - count // 5))
+    # Mix in family prefixes (prefix/contains tiers) and misses, like real batches.
+    while len(symbols) < count:
+        choice = rng.random()
+        if choice < 0.5:
+            symbols.append(rng.choice(GENE_FAMILIES) + str(rng.randint(1, 9)))
+        else:
+            symbols.append(f"missing{rng.randint(0, 10_000)}")
+    return list(dict.fromkeys(symbols))[:count]
+
+
+def legacy_lookup(db: _BenchmarkDb, entity_type: str, symbols: list[str], limit: int) -> dict:
+    return {
+        (symbol, taxon): db.search_entities(
+            entity_type=entity_type,
+            search_pattern=symbol,
+            taxon_curie=taxon,
+            include_synonyms=True,
+            limit=limit,
+        )
+        for symbol in symbols
+        for taxon in TAXA
+    }
+
+
+def bulk_lookup(db: _BenchmarkDb, entity_type: str, symbols: list[str], limit: int) -> dict:
+    return search_entities_bulk(
+        db,
+        entity_type=entity_type,
+        symbols=symbols,
+        taxon_curies=TAXA,
+        include_synonyms=True,
+        limit=limit,
+    )
+
+
+def time_call(func, repeats: int) -> tuple[float, Any]:
+    durations = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations), result
+
+
+def main() -> int:
+    args = parse_args()
+    schema = f"agr_bulk_lookup_bench_{os.getpid()}"
+    engine = create_engine(
+        args.database_url,
+        connect_args={"options": f"-csearch_path={schema}"},
+    )
+    db = _BenchmarkDb(engine)
+    rng = random.Random(args.seed)
+    rows = []
+    parity_ok = True
+    try:
+        known_symbols = create_fixture(engine, schema, args)
+        for count in [int(value) for value in args.symbol_counts.split(",") if value.strip()]:
+            symbols = pick_symbols(rng, known_symbols, count)
+            for entity_type in ("gene", "allele"):
+                legacy_ms, legacy = time_call(
+                    lambda: legacy_lookup(db, entity_type, symbols, args.limit),
+                    args.repeats,
+                )
+                bulk_ms, bulk = time_call(
+                    lambda: bulk_lookup(db, entity_type, symbols, args.limit),
+                    args.repeats,
+                )
+                matches = legacy == bulk
+                parity_ok = parity_ok and matches
+                row = {
+                    "entity_type": entity_type,
+                    "symbols": len(symbols),
+                    "taxa": len(TAXA),
+                    "legacy_queries": len(symbols) * len(TAXA),
+                    "legacy_ms": round(legacy_ms, 1),
+                    "bulk_ms": round(bulk_ms, 1),
+                    "speedup": round(legacy_ms / bulk_ms, 1) if bulk_ms else None,
+                    "candidates": sum(len(results) for results in bulk.values()),
+                    "parity": matches,
+                }
+                rows.append(row)
+                print(json.dumps(row))
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        engine.dispose()
+
+    report = {
+        "genes_per_taxon": args.genes_per_taxon,
+        "alleles_per_gene": args.alleles_per_gene,
+        "limit": args.limit,
+        "results": rows,
+        "parity_ok": parity_ok,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 0 if parity_ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Benchmark the vectorized MMR diversifier against the legacy pairwise loop.
+
+Runs both implementations over synthetic clustered candidate pools (the shape
+``hybrid_search_chunks`` hands to MMR), checks that they pick the same chunks
+in the same order, and reports median latency per pool size.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MMR_MODULE_PATH = REPO_ROOT / "backend" / "src" / "lib" / "weaviate_client" / "mmr_diversifier.py"
+
+
+def load_mmr_module():
+    # Load the module by path so the weaviate_client package __init__ (which
+    # needs the full backend .env) is not imported.
+    spec = importlib.util.spec_from_file_location("mmr_diversifier", MMR_MODULE_PATH)
+    if spec is None or spec.loader is None:
+        raise SystemExit(f"Unable to load MMR module from {MMR_MODULE_PATH}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_mmr = load_mmr_module()
+mmr_diversify = _mmr.mmr_diversify
+mmr_diversify_batch = _mmr.mmr_diversify_batch
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark vectorized MMR against the legacy pairwise implementation.",
+    )
+    parser.add_argument(
+        "--pool-sizes",
+        default="25,100,500",
+        help="Comma-separated candidate pool sizes",
+    )
+    parser.add_argument("--dim", type=int, default=1024, help="Embedding dimension")
+    parser.add_argument("--top-k", type=int, default=10, help="Results selected per pool")
+    parser.add_argument("--lambda-param", type=float, default=0.5, help="MMR lambda")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repetitions per pool size")
+    parser.add_argument(
+        "--batch-queries",
+        type=int,
+        default=4,
+        help="Number of pools diversified together in the batched-mode measurement",
+    )
+    parser.add_argument(
+        "--skip-legacy-above",
+        type=int,
+        default=500,
+        help="Skip timing the legacy loop for pools larger than this (it is very slow)",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    return parser.parse_args()
+
+
+def legacy_mmr_diversify(
+    chunks: list[dict[str, Any]],
+    lambda_param: float,
+    top_k: int,
+    vector_field: str = "_vector",
+) -> list[dict[str, Any]]:
+    """The pairwise implementation that shipped before the vectorized engine."""
+    chunks_with_vectors = [c for c in chunks if vector_field in c]
+    scores = np.array([c.get("score", 0) for c in chunks_with_vectors])
+    if scores.max() > 0:
+        scores = scores / scores.max()
+
+    selected: list[int] = []
+    remaining = list(range(len(chunks_with_vectors)))
+    while remaining and len(selected) < top_k:
+        if not selected:
+            best_idx = remaining[int(np.argmax(scores[remaining]))]
+        else:
+            best_mmr = -float("inf")
+            best_idx = None
+            for idx in remaining:
+                max_sim = 0.0
+                for sel_idx in selected:
+                    vec1 = chunks_with_vectors[idx][vector_field]
+                    vec2 = chunks_with_vectors[sel_idx][vector_field]
+                    if isinstance(vec1, dict):
+                        vec1 = vec1.get("default") or list(vec1.values())[0]
+                    if isinstance(vec2, dict):
+                        vec2 = vec2.get("default") or list(vec2.values())[0]
+                    vec1 = np.array(vec1)
+                    vec2 = np.array(vec2)
+                    sim = np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2) + 1e-10)
+                    max_sim = max(max_sim, sim)
+                mmr = lambda_param * scores[idx] - (1 - lambda_param) * max_sim
+                if mmr > best_mmr:
+                    best_mmr = mmr
+                    best_idx = idx
+        selected.append(best_idx)
+        remaining.remove(best_idx)
+
+    result = []
+    for idx in selected:
+        chunk = chunks_with_vectors[idx].copy()
+        chunk.pop(vector_field, None)
+        result.append(chunk)
+    return result
+
+
+def build_pool(rng: np.random.Generator, size: int, dim: int) -> list[dict[str, Any]]:
+    centers = rng.normal(size=(8, dim))
+    pool = []
+    for index in range(size):
+        vector = centers[index % len(centers)] + 0.3 * rng.normal(size=dim)
+        pool.append(
+            {
+                "id": f"chunk-{index}",
+                "score": float(rng.uniform(0.05, 1.0)),
+                # Weaviate returns named vectors; exercise the dict unwrap path.
+                "_vector": {"default": vector.tolist()},
+            }
+        )
+    return pool
+
+
+def time_call(func, repeats: int) -> tuple[float, Any]:
+    durations = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations), result
+
+
+def main() -> int:
+    args = parse_args()
+    rng = np.random.default_rng(args.seed)
+    pool_sizes = [int(value) for value in args.pool_sizes.split(",") if value.strip()]
+    rows = []
+    parity_ok = True
+
+    for size in pool_sizes:
+        pool = build_pool(rng, size, args.dim)
+        vectorized_ms, vectorized = time_call(
+            lambda: mmr_diversify(pool, args.lambda_param, args.top_k),
+            args.repeats,
+        )
+        row: dict[str, Any] = {
+            "pool_size": size,
+            "vectorized_ms": round(vectorized_ms, 3),
+        }
+
+        if size <= args.skip_legacy_above:
+            legacy_ms, legacy = time_call(
+                lambda: legacy_mmr_diversify(pool, args.lambda_param, args.top_k),
+                max(1, min(args.repeats, 3)),
+            )
+            matches = [c["id"] for c in vectorized] == [c["id"] for c in legacy]
+            parity_ok = parity_ok and matches
+            row.update(
+                {
+                    "legacy_ms": round(legacy_ms, 3),
+                    "speedup": round(legacy_ms / vectorized_ms, 1) if vectorized_ms else None,
+                    "parity": matches,
+                }
+            )
+
+        pools = [build_pool(rng, size, args.dim) for _ in range(args.batch_queries)]
+        sequential_ms, sequential = time_call(
+            lambda: [mmr_diversify(p, args.lambda_param, args.top_k) for p in pools],
+            args.repeats,
+        )
+        batched_ms, batched = time_call(
+            lambda: mmr_diversify_batch(pools, args.lambda_param, args.top_k),
+            args.repeats,
+        )
+        batch_matches = [[c["id"] for c in group] for group in sequential] == [
+            [c["id"] for c in group] for group in batched
+        ]
+        parity_ok = parity_ok and batch_matches
+        row.update(
+            {
+                "batch_queries": args.batch_queries,
+                "sequential_batch_ms": round(sequential_ms, 3),
+                "batched_ms": round(batched_ms, 3),
+                "batch_parity": batch_matches,
+            }
+        )
+        rows.append(row)
+        print(json.dumps(row))
+
+    report = {
+        "dim": args.dim,
+        "top_k": args.top_k,
+        "lambda_param": args.lambda_param,
+        "results": rows,
+        "parity_ok": parity_ok,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 0 if parity_ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())